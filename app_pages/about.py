@@ -0,0 +1,13 @@
+"""About page."""
+import streamlit as st
+
+st.markdown("### 💡 About Career Pulse")
+
+# The 'about-card' class will override the background if black text is needed
+st.markdown("""
+<div class="career-info-card about-card"> 
+    <h4>🚀 Welcome to Career Pulse Beta!</h4>
+    <p>This is an AI-powered career guidance tool designed to help you discover your ideal career path based on your interests, skills, and preferences. This app was developed by Ayan Gantayat and design by Shreemoyee Shaw</p>
+    <p><em>We're constantly improving to provide you with the best career guidance experience!</em></p>
+</div>
+""", unsafe_allow_html=True)
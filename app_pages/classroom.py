@@ -0,0 +1,7 @@
+"""Classroom page: score a whole roster at once (see bulk_upload.py)."""
+from app_state import TOP_CAREERS, load_app_model, model_captions
+from bulk_upload import render_bulk_upload
+
+model_version, _, ranker = load_app_model()
+model_captions(model_version, ranker)
+render_bulk_upload(k=TOP_CAREERS)
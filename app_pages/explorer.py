@@ -0,0 +1,32 @@
+"""Career explorer page: details of any career, from CAREER_INFO alone."""
+import streamlit as st
+
+from career_info import CAREER_INFO, CAREER_OPTIONS
+
+
+@st.fragment
+def career_explorer():
+    st.markdown("### 🔍 Explore Career Details")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        # This is the selectbox whose font needs to be black (already handled by .stSelectbox CSS)
+        selected_career = st.selectbox("Select a Career to Explore", CAREER_OPTIONS)
+
+    if selected_career:
+        career_info = CAREER_INFO[selected_career]
+
+        # The 'career-info-card' class will now apply the desired gradient style
+        st.markdown(f"""
+        <div class="career-info-card"> 
+            <h3>🎯 {selected_career}</h3>
+            <p><strong>📝 Description:</strong> {career_info['description']}</p>
+            <p><strong>🛠️ Key Skills:</strong> {', '.join(career_info['skills'])}</p>
+            <p><strong>🎓 Education:</strong> {career_info['education']}</p>
+            <p><strong>💰 Salary Range:</strong> {career_info['salary']}</p>
+            <p><strong>📈 Career Outlook:</strong> {career_info['outlook']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+career_explorer()
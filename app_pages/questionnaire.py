@@ -0,0 +1,236 @@
+"""Questionnaire page: age, the four question tabs and a live preview.
+
+Each tab is a form whose Save button stores that section in the session's
+profile_answers (see app_state), where the results page reads it.
+"""
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from app_state import (
+    DEFAULT_AGE, QUESTIONNAIRE_TABS, load_app_model, model_captions, profile_sections, profile_vector,
+    session_answers,
+)
+from career_schema import AGE_RANGE, CAREER_LABELS
+
+
+def classify_age(age):
+    if age <= 18:
+        return "Teenager/Young Adult"
+    elif 19 <= age <= 25:
+        return "Young Professional"
+    elif 26 <= age <= 40:
+        return "Mid-Career"
+    else:
+        return "Experienced Professional"
+
+
+# Age, question tabs, interest profile and preview. Saving a tab or moving
+# the age slider reruns only this fragment, not the entrypoint's CSS and
+# sidebar.
+@st.fragment
+def questionnaire():
+    # Saved answers live outside the widgets, so they survive this page not being shown
+    saved_answers = session_answers()
+    subjects, skills, interests, preferences = profile_sections(saved_answers)
+
+    age = st.slider("🎂 Age", *AGE_RANGE, value=saved_answers.get("age", DEFAULT_AGE), key="age")
+    saved_answers["age"] = age
+    st.info(f"Age Group: **{classify_age(age)}**")
+
+    # -------------------------------
+    # 📚 MAIN CONTENT - INPUT SECTIONS
+    # -------------------------------
+    col_main, col_side = st.columns([3, 1])
+
+    with col_main:
+        tabs = st.tabs([
+            "📘 Academic Interests",
+            "🛠️ Skills Assessment",
+            "🎯 Field Interests",
+            "🧠 Work Preferences",
+        ])
+
+        with tabs[0], st.form("subjects_form", border=False):
+            st.markdown("### 📚 Rate Your Academic Interests")
+            st.markdown("*Rate from 0 (Not interested) to 5 (Very interested)*")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**🔢 Mathematics**")
+                subjects["Maths - Algebra"] = st.slider("Algebra", 0, 5, value=subjects["Maths - Algebra"], key="algebra")
+                subjects["Maths - Calculus"] = st.slider("Calculus", 0, 5, value=subjects["Maths - Calculus"], key="calculus")
+                
+                st.markdown("**🔬 Sciences**")
+                subjects["Science - Biology"] = st.slider("Biology", 0, 5, value=subjects["Science - Biology"], key="biology")
+                subjects["Science - Chemistry"] = st.slider("Chemistry", 0, 5, value=subjects["Science - Chemistry"], key="chemistry")
+                subjects["Science - Physics"] = st.slider("Physics", 0, 5, value=subjects["Science - Physics"], key="physics")
+                
+                st.markdown("**💻 Computer Science**")
+                subjects["Computer Science - Programming"] = st.slider("Programming", 0, 5, value=subjects["Computer Science - Programming"], key="programming")
+                subjects["Computer Science - Data Structures"] = st.slider("Data Structures", 0, 5, value=subjects["Computer Science - Data Structures"], key="data_structures")
+            
+            with col2:
+                st.markdown("**📜 History**")
+                subjects["History - Ancient"] = st.slider("Ancient History", 0, 5, value=subjects["History - Ancient"], key="ancient_history")
+                subjects["History - Modern"] = st.slider("Modern History", 0, 5, value=subjects["History - Modern"], key="modern_history")
+                
+                st.markdown("**💼 Economics**")
+                subjects["Economics - Microeconomics"] = st.slider("Microeconomics", 0, 5, value=subjects["Economics - Microeconomics"], key="microeconomics")
+                subjects["Economics - Macroeconomics"] = st.slider("Macroeconomics", 0, 5, value=subjects["Economics - Macroeconomics"], key="macroeconomics")
+                
+                st.markdown("**📖 Literature & Arts**")
+                subjects["Literature - Fiction"] = st.slider("Fiction", 0, 5, value=subjects["Literature - Fiction"], key="fiction")
+                subjects["Literature - Poetry"] = st.slider("Poetry", 0, 5, value=subjects["Literature - Poetry"], key="poetry")
+                subjects["Art - Painting"] = st.slider("Painting", 0, 5, value=subjects["Art - Painting"], key="painting")
+                subjects["Art - Sculpture"] = st.slider("Sculpture", 0, 5, value=subjects["Art - Sculpture"], key="sculpture")
+
+            if st.form_submit_button(f"💾 Save {QUESTIONNAIRE_TABS['subjects']}", type="primary"):
+                saved_answers["subjects"] = dict(subjects)
+            
+
+        with tabs[1], st.form("skills_form", border=False):
+            st.markdown("### 🛠️ Skills Assessment")
+            st.markdown("*Rate your proficiency from 0 (Beginner) to 5 (Expert)*")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**🧩 Problem Solving**")
+                skills["Problem Solving - Logical"] = st.slider("Logical Problem Solving", 0, 5, value=skills["Problem Solving - Logical"], key="ps_logical")
+                skills["Problem Solving - Creative"] = st.slider("Creative Problem Solving", 0, 5, value=skills["Problem Solving - Creative"], key="ps_creative")
+                
+                st.markdown("**🎨 Creativity**")
+                skills["Creativity - Visual"] = st.slider("Visual Creativity", 0, 5, value=skills["Creativity - Visual"], key="creativity_visual")
+                skills["Creativity - Innovation"] = st.slider("Innovation", 0, 5, value=skills["Creativity - Innovation"], key="creativity_innovation")
+                
+                st.markdown("**💬 Communication**")
+                skills["Communication - Written"] = st.slider("Written Communication", 0, 5, value=skills["Communication - Written"], key="comm_written")
+                skills["Communication - Verbal"] = st.slider("Verbal Communication", 0, 5, value=skills["Communication - Verbal"], key="comm_verbal")
+            
+            with col2:
+                st.markdown("**👥 Leadership**")
+                skills["Leadership - Team Management"] = st.slider("Team Management", 0, 5, value=skills["Leadership - Team Management"], key="leadership_team")
+                skills["Leadership - Initiative"] = st.slider("Taking Initiative", 0, 5, value=skills["Leadership - Initiative"], key="leadership_initiative")
+
+            if st.form_submit_button(f"💾 Save {QUESTIONNAIRE_TABS['skills']}", type="primary"):
+                saved_answers["skills"] = dict(skills)
+            
+
+        with tabs[2], st.form("interests_form", border=False):
+            st.markdown("### 🎯 Field Interests")
+            st.markdown("*Rate your interest in these professional fields*")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**💻 Technology**")
+                interests["Technology - Artificial Intelligence"] = st.slider("Artificial Intelligence", 0, 5, value=interests["Technology - Artificial Intelligence"], key="tech_ai")
+                interests["Technology - Cybersecurity"] = st.slider("Cybersecurity", 0, 5, value=interests["Technology - Cybersecurity"], key="tech_cyber")
+                interests["Technology - Web Development"] = st.slider("Web Development", 0, 5, value=interests["Technology - Web Development"], key="tech_web")
+                
+                st.markdown("**💼 Business**")
+                interests["Business - Marketing"] = st.slider("Marketing", 0, 5, value=interests["Business - Marketing"], key="biz_marketing")
+                interests["Business - Finance"] = st.slider("Finance", 0, 5, value=interests["Business - Finance"], key="biz_finance")
+                interests["Business - Management"] = st.slider("Management", 0, 5, value=interests["Business - Management"], key="biz_management")
+                
+                st.markdown("**🎨 Art & Design**")
+                interests["Art And Design - Visual Arts"] = st.slider("Visual Arts", 0, 5, value=interests["Art And Design - Visual Arts"], key="art_visual")
+                interests["Art And Design - Industrial Design"] = st.slider("Industrial Design", 0, 5, value=interests["Art And Design - Industrial Design"], key="art_industrial")
+            
+            with col2:
+                st.markdown("**🏥 Healthcare**")
+                interests["Healthcare - Clinical Research"] = st.slider("Clinical Research", 0, 5, value=interests["Healthcare - Clinical Research"], key="health_research")
+                interests["Healthcare - Patient Care"] = st.slider("Patient Care", 0, 5, value=interests["Healthcare - Patient Care"], key="health_care")
+                
+                st.markdown("**🎓 Education**")
+                interests["Education - Primary/Secondary"] = st.slider("Primary/Secondary Education", 0, 5, value=interests["Education - Primary/Secondary"], key="edu_primary")
+                interests["Education - Higher Education"] = st.slider("Higher Education", 0, 5, value=interests["Education - Higher Education"], key="edu_higher")
+                
+                st.markdown("**⚙️ Engineering**")
+                interests["Engineering - Mechanical"] = st.slider("Mechanical Engineering", 0, 5, value=interests["Engineering - Mechanical"], key="eng_mechanical")
+                interests["Engineering - Electrical"] = st.slider("Electrical Engineering", 0, 5, value=interests["Engineering - Electrical"], key="eng_electrical")
+                
+                st.markdown("**✍️ Writing**")
+                interests["Writing - Creative Writing"] = st.slider("Creative Writing", 0, 5, value=interests["Writing - Creative Writing"], key="writing_creative")
+                interests["Writing - Technical Writing"] = st.slider("Technical Writing", 0, 5, value=interests["Writing - Technical Writing"], key="writing_technical")
+
+            if st.form_submit_button(f"💾 Save {QUESTIONNAIRE_TABS['interests']}", type="primary"):
+                saved_answers["interests"] = dict(interests)
+            
+
+        with tabs[3], st.form("preferences_form", border=False):
+            st.markdown("### 🧠 Work Preferences")
+            st.markdown("*Tell us about your work style preferences*")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                preferences["Enjoy solving complex problems?"] = st.selectbox("🧩 Enjoy solving complex problems?", ["Yes", "No"], index=["Yes", "No"].index(preferences["Enjoy solving complex problems?"]), key="pref_complex")
+                preferences["Prefer working with machines?"] = st.selectbox("⚙️ Prefer working with machines?", ["Yes", "No"], index=["Yes", "No"].index(preferences["Prefer working with machines?"]), key="pref_machines")
+                preferences["Interested in research?"] = st.selectbox("🔬 Interested in research?", ["Yes", "No"], index=["Yes", "No"].index(preferences["Interested in research?"]), key="pref_research")
+            
+            with col2:
+                preferences["Enjoy working with people?"] = st.selectbox("👥 Enjoy working with people?", ["Yes", "No"], index=["Yes", "No"].index(preferences["Enjoy working with people?"]), key="pref_people")
+                preferences["Prefer working indoors?"] = st.selectbox("🏢 Prefer working indoors?", ["Yes", "No"], index=["Yes", "No"].index(preferences["Prefer working indoors?"]), key="pref_indoors")
+
+            if st.form_submit_button(f"💾 Save {QUESTIONNAIRE_TABS['preferences']}", type="primary"):
+                saved_answers["preferences"] = dict(preferences)
+
+    with col_side:
+        # Profile visualization toggle
+        show_profile = st.checkbox("📊 Show Interest Profile", value=False)
+        
+        if show_profile:
+            subject_scores_df = pd.DataFrame(subjects.items(), columns=["Subject", "Score"])
+            skill_scores_df = pd.DataFrame(skills.items(), columns=["Skill", "Score"])
+            interest_scores_df = pd.DataFrame(interests.items(), columns=["Interest", "Score"])
+
+            avg_subject_interest = subject_scores_df["Score"].mean()
+            avg_skill_level = skill_scores_df["Score"].mean()
+            avg_field_interest = interest_scores_df["Score"].mean()
+
+            profile_data = pd.DataFrame(
+                {
+                    "Category": ["Subjects", "Skills", "Interests"],
+                    "Average Score": [
+                        avg_subject_interest,
+                        avg_skill_level,
+                        avg_field_interest,
+                    ],
+                }
+            )
+
+            chart = (
+                alt.Chart(profile_data)
+                .mark_bar()
+                .encode(
+                    x="Category",
+                    y="Average Score",
+                    tooltip=["Category", "Average Score"],
+                )
+                .properties(title="Your Interest Profile")
+            )
+            st.altair_chart(chart, use_container_width=True)
+
+    unsaved = [title for section, title in QUESTIONNAIRE_TABS.items() if section not in saved_answers]
+    if unsaved:
+        st.info(f"💾 Not saved yet: {', '.join(unsaved)}. Press Save in each tab so your answers are used.")
+
+    # Same encoder as the results page and the prediction service
+    input_vector = profile_vector(saved_answers)
+
+    # Early-exit vote: the same career Analyze ranks first, without its probabilities.
+    # Fetched here, not passed in, so a swapped model is used (see load_app_model)
+    _, _, ranker = load_app_model(show_errors=False)
+    if ranker is not None:
+        preview = ranker.best_match(input_vector)
+        st.caption(f"⚡ Current best match: **{CAREER_LABELS[preview]}** (updates when you save a tab)")
+
+    st.page_link("app_pages/results.py", label="Get your career recommendation", icon="🎯")
+
+
+model_version, _, ranker = load_app_model()
+model_captions(model_version, ranker)
+questionnaire()
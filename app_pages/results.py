@@ -0,0 +1,217 @@
+"""Results page: runs the full model on the saved questionnaire and shows the matches.
+
+The email report is sent from here too, so SendGrid is only imported by
+this page.
+"""
+import ssl
+
+import streamlit as st
+from sendgrid import SendGridAPIClient
+from sendgrid.helpers.mail import Mail
+
+from app_state import (
+    QUESTIONNAIRE_TABS, TOP_CAREERS, load_app_model, model_captions, profile_sections, profile_vector,
+    session_answers,
+)
+from career_info import CAREER_INFO
+from career_schema import CAREER_LABELS
+
+# Disable SSL verification (remove after fixing certificate issue)
+ssl._create_default_https_context = ssl._create_unverified_context
+
+
+# --- EMAIL SENDING FUNCTION ---
+def send_career_email(user_email, recipient_name, job_title):
+    """Sends an email with career details to the user."""
+    # It's highly recommended NOT to hardcode API keys directly in your code.
+    # Use Streamlit secrets or environment variables for production.
+    SENDGRID_API_KEY = st.secrets["SENDGRID_API_KEY"]
+    if not SENDGRID_API_KEY:
+        st.error("Error: SendGrid API key is missing. Please configure it in your environment variables.")
+        return False
+
+    career_info = CAREER_INFO.get(job_title)
+    if not career_info:
+        st.error(f"Error: Could not find career information for '{job_title}'.")
+        return False
+
+
+
+    html_content = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Your CareerPulse Prediction: {job_title}!</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+            .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; text-align: center; }}
+            .content {{ padding: 20px; }}
+            .career-details {{ background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 15px 0; }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>🎯 CareerPulse Prediction Results</h1>
+        </div>
+        <div class="content">
+            <h2>Congratulations, {recipient_name}!</h2>
+            <p>We're excited to share your personalized career prediction from CareerPulse.</p>
+            <p>Based on your interests, skills, and preferences, our AI suggests that you might find a fulfilling career as a <strong>{job_title}</strong>.</p>
+            
+            <div class="career-details">
+                <h3>🎯 {job_title}</h3>
+                <p><strong>Description:</strong> {career_info['description']}</p>
+                <p><strong>Required Skills:</strong> {', '.join(career_info['skills'])}</p>
+                <p><strong>Education:</strong> {career_info['education']}</p>
+                <p><strong>Salary Range:</strong> {career_info['salary']}</p>
+                <p><strong>Career Outlook:</strong> {career_info['outlook']}</p>
+            </div>
+             <p>We encourage you to explore this career further and consider the next steps in your journey!</p>
+                <p><em>Please check your spam folder if you don't see this email in your inbox.</em></p>
+                
+                <p>Best regards,<br>
+                The CareerPulse Team<br>
+                <small>Ayan Gantayat & Shreemoyee Shaw</small></p>
+            </div>
+        </body>
+        </html>
+        """
+
+    message = Mail(
+        from_email="ayangantayat095@gmail.com",
+        to_emails=user_email,
+        subject=f"Your CareerPulse Prediction: {job_title}!",
+        html_content=html_content,
+    )
+    
+    try:
+        sg = SendGridAPIClient(SENDGRID_API_KEY)
+        response = sg.send(message)
+        if 200 <= response.status_code < 300:
+            return True
+        else:
+            st.error(f"Error sending email. Status code: {response.status_code}")
+            return False
+    except Exception as e:
+        st.error(f"An error occurred while sending the email: {e}")
+        return False
+
+
+# Analysis and career details. Analyze and the email report rerun only this
+# fragment.
+@st.fragment
+def results():
+    # -------------------------------
+    # 🔍 PREDICTION SECTION
+    # -------------------------------
+    st.markdown("### 🎯 Get Your Career Recommendation")
+
+    saved_answers = session_answers()
+    unsaved = [title for section, title in QUESTIONNAIRE_TABS.items() if section not in saved_answers]
+    if unsaved:
+        st.info(f"💾 Not saved yet: {', '.join(unsaved)}. Save them on the questionnaire page so your answers are used.")
+        st.page_link("app_pages/questionnaire.py", label="Back to the questionnaire", icon="📝")
+
+    subjects, skills, interests, preferences = profile_sections(saved_answers)
+    # Same encoder as the questionnaire preview and the prediction service
+    input_vector = profile_vector(saved_answers)
+    input_data = input_vector[0].tolist()
+
+    if st.button("🔍 Analyze My Profile & Suggest Careers", type="primary"):
+        # Use user_name from session_state
+        current_user_name = st.session_state.get('user_name', 'Guest')
+        current_user_email = st.session_state.get('user_email', 'N/A')
+
+        if current_user_name == 'Guest': # Check if a proper name was set during login
+            st.warning("⚠️ Please log in with your name to continue.")
+        elif current_user_email == 'N/A' or "@gmail.com" not in current_user_email: # Check for a valid email from session state
+            st.warning("⚠️ Please log in with a valid Gmail address.")
+        elif not all(value is not None for value in subjects.values()) or not all(
+            value is not None for value in skills.values()
+        ) or not all(value is not None for value in interests.values()) or not all(
+            value is not None for value in preferences.values()
+        ):
+            st.warning("⚠️ Please complete all sections to get an accurate prediction.")
+        else:
+            with st.spinner("🤖 Analyzing your profile and finding the perfect career match..."):
+                # Fetched here, not passed in, so a swapped model is used (see load_app_model)
+                _, model, ranker = load_app_model(show_errors=False)
+                try:
+                    if ranker is not None:
+                        # One predict_proba pass ranks every career; repeated profiles hit the cache.
+                        top_careers = ranker.top_k(input_vector, k=TOP_CAREERS)
+                    else:
+                        top_careers = [(model.predict(input_vector)[0], None)]
+                    prediction = top_careers[0][0]
+                    predicted_career = CAREER_LABELS[prediction]
+                    st.session_state.predicted_career = predicted_career
+                    st.session_state.input_data = input_data 
+                    st.session_state.top_careers = [(CAREER_LABELS[c], p) for c, p in top_careers]
+                    
+                    # Display prediction result
+                    st.markdown(f"""
+                    <div class="prediction-result">
+                        <h2>🎉 Congratulations, {current_user_name}!</h2>
+                        <h3>Your recommended career path is:</h3>
+                        <h1>🎯 {predicted_career}</h1>
+                        <p>This recommendation is based on your unique profile of interests, skills, and preferences.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    if len(top_careers) > 1:
+                        st.markdown("**🥈 Other strong matches:**")
+                        for career, probability in st.session_state.top_careers[1:]:
+                            st.markdown(f"- {career} ({probability:.0%} match)")
+                    
+                    st.balloons()  # Celebration effect
+                    
+                except Exception as e:
+                    st.error(f"❗ An error occurred during prediction: {e}")
+                    st.info("Please ensure the model is trained and loaded correctly.")
+
+
+    # -------------------------------
+    # 📧 EMAIL & CAREER DETAILS & ROADMAP SECTION
+    # -------------------------------
+    if 'predicted_career' in st.session_state:
+        predicted_career = st.session_state.predicted_career
+        career_info = CAREER_INFO.get(predicted_career, {}) # Use .get() for safety
+        
+
+        st.markdown("### 📋 Your Career Details")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.markdown(f"""
+            <div class="career-info-card">
+                <h3>🎯 {predicted_career}</h3>
+                <p><strong>📝 Description:</strong> {career_info.get('description', 'N/A')}</p>
+                <p><strong>🛠️ Required Skills:</strong> {', '.join(career_info.get('skills', ['N/A']))}</p>
+                <p><strong>🎓 Education Requirements:</strong> {career_info.get('education', 'N/A')}</p>
+                <p><strong>💰 Salary Range:</strong> {career_info.get('salary', 'N/A')}</p>
+                <p><strong>📈 Career Outlook:</strong> {career_info.get('outlook', 'N/A')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+          
+            # --- END NEW ---
+        
+        with col2:
+            st.markdown("### 📧 Get Detailed Report")
+            send_email_report = st.checkbox("📨 Send detailed career report to my email") 
+            
+            if send_email_report and st.button("Send Report", type="secondary"):
+                email_sent = send_career_email(st.session_state.get('user_email'), st.session_state.get('user_name'), predicted_career)
+                if email_sent:
+                    st.success("📧 Career report sent successfully!")
+                    st.info("Please check your email (including spam folder) for the detailed report.")
+                else:
+                    st.error(
+                        "Failed to send email. Please check your email address and try again. Please also check your SendGrid API key and ensure it is correctly configured."
+                    )
+
+
+model_version, _, ranker = load_app_model()
+model_captions(model_version, ranker)
+results()
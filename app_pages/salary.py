@@ -0,0 +1,14 @@
+"""Salary & outlook page: compares the careers in CAREER_INFO (see salary_catalog.py)."""
+import streamlit as st
+
+from salary_catalog import get_salary_catalog
+
+
+st.markdown("### 📊 Career Salary & Outlook Analysis")
+
+# Built once per catalog; the outlook filter and sort are chart inputs that
+# run in the browser, so changing them does not rerun this page.
+catalog = get_salary_catalog()
+st.vega_lite_chart(catalog.chart_spec(), use_container_width=True)
+if catalog.invalid:
+    st.caption(f"ℹ️ No salary range listed for: {', '.join(catalog.invalid)}")
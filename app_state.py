@@ -0,0 +1,128 @@
+"""Model and session state shared by the Streamlit pages.
+
+main.py is only the entrypoint. It draws the header and the sidebar and runs
+the page chosen in ``st.navigation``. Each page in app_pages/ imports only
+what it draws, so opening the career explorer neither builds the
+questionnaire nor loads the model. The questionnaire, results and classroom
+pages share this module, and pages hand data to each other through
+``st.session_state``:
+
+    profile_answers   the saved questionnaire: "age" and one dict per section
+    predicted_career  the best match of the last analysis
+    top_careers       [(career, probability), ...] of the last analysis
+    input_data        the feature vector that was analyzed
+
+After the first model load the app calls ``gc.freeze()`` once. Streamlit
+runs a full ``gc.collect()`` after every script run, and by then the heap is
+mostly imported libraries and the model, which are never garbage. Freezing
+them moves them out of the collector's generations, so that collection stays
+short. Later reloads are not frozen, so a replaced model can still be
+collected. This is done here rather than in model_store, whose holder is
+also used by the prediction service and worker processes.
+"""
+import gc
+import os
+
+import streamlit as st
+
+from career_ranking import get_ranker
+from career_schema import SECTION_FEATURES, encode_profile, load_career_model
+from forest_engine import default_model_path
+from model_store import get_model_holder
+
+# Careers listed after Analyze, best first
+TOP_CAREERS = 3
+# Host-wide SQLite prediction cache shared by all server processes; set to "" to disable
+PREDICTION_CACHE_PATH = os.environ.get("CAREERPULSE_PREDICTION_CACHE", ".prediction_cache.sqlite3")
+# Milliseconds to gather concurrent sessions' predictions into one batch; 0 scores each directly
+MICRO_BATCH_MS = float(os.environ.get("CAREERPULSE_MICRO_BATCH_MS", "0"))
+# Worker processes that run inference outside the Streamlit process; 0 scores in-process
+PREDICTION_WORKERS = int(os.environ.get("CAREERPULSE_PREDICTION_WORKERS", "0"))
+
+# Questionnaire sections with one form (and one Save button) each, by tab title
+QUESTIONNAIRE_TABS = {
+    "subjects": "Academic Interests",
+    "skills": "Skills Assessment",
+    "interests": "Field Interests",
+    "preferences": "Work Preferences",
+}
+DEFAULT_AGE = 25
+
+# Session keys cleared on logout
+SESSION_KEYS = ("profile_answers", "predicted_career", "top_careers", "input_data")
+
+_gc_frozen = False
+
+
+def session_answers():
+    """The session's saved questionnaire, created empty on first use."""
+    return st.session_state.setdefault("profile_answers", {})
+
+
+def profile_sections(answers):
+    """The subjects, skills, interests and preferences dicts: defaults overlaid with saved ``answers``."""
+    sections = []
+    for section in QUESTIONNAIRE_TABS:
+        default = "No" if section == "preferences" else 0
+        saved = answers.get(section, {})
+        sections.append({name: saved.get(name, default) for name in SECTION_FEATURES[section]})
+    return sections
+
+
+def profile_vector(answers):
+    """The model input row for the saved answers."""
+    return encode_profile(answers.get("age", DEFAULT_AGE), *profile_sections(answers)).reshape(1, -1)
+
+
+def load_app_model(show_errors=True):
+    """Returns (model_version, model, ranker); ranker is None if the model could not be loaded.
+
+    Fragments call this in their own body on every rerun, since Streamlit
+    replays a fragment with the arguments of the last full run and those
+    would pin it to a replaced version. They pass ``show_errors=False``: the
+    page's full run has already shown why the model is missing.
+    """
+    # Load or define model (shared by all sessions, reloaded when the file changes)
+    model_version = None
+    ranker = None
+    try:
+        # Prefer the memory-mapped flat arrays, shared with the other server processes;
+        # either artifact is served through the low-latency ForestEngine.
+        model_version = get_model_holder(default_model_path(), loader=load_career_model).get()
+        model = model_version.model
+        _freeze_heap()
+        ranker = get_ranker(
+            model_version, shared_path=PREDICTION_CACHE_PATH,
+            micro_batch_wait=MICRO_BATCH_MS / 1e3, workers=PREDICTION_WORKERS,
+        )
+    except FileNotFoundError:
+        if show_errors:
+            st.warning(
+                "Warning: 'career_model.pkl' not found. A default model will be used, but accuracy may be low. Consider training and saving a model for better predictions."
+            )
+        from sklearn.ensemble import RandomForestClassifier
+        model = RandomForestClassifier()
+    except Exception as e:
+        if show_errors:
+            st.error(f"Error loading the model: {e}")
+        from sklearn.ensemble import RandomForestClassifier
+        model = RandomForestClassifier()
+    return model_version, model, ranker
+
+
+def _freeze_heap():
+    """Moves everything alive after the first model load out of the collector's reach, once."""
+    global _gc_frozen
+    if not _gc_frozen:
+        _gc_frozen = True
+        gc.collect()  # so cycles that are already garbage are not frozen with it
+        gc.freeze()
+
+
+def model_captions(model_version, ranker):
+    """Sidebar captions describing the loaded model and, if enabled, micro-batching."""
+    with st.sidebar:
+        if model_version is not None:
+            st.caption(f"🧠 {model_version.describe()}")
+        if ranker is not None and MICRO_BATCH_MS:
+            st.caption(f"📦 {ranker.model.metrics.describe()}")
@@ -0,0 +1,240 @@
+"""Batch scoring of large cohort files.
+
+Schools send tens of thousands of profiles at once. This CLI streams a CSV
+or Parquet file in chunks of ``--chunk-rows`` rows. Columns are matched to
+the model's features by name, ignoring case and surrounding spaces, and
+other columns are ignored unless listed with ``--id-column``. Chunks are
+scored in a process pool: every worker opens the model once, and a
+memory-mapped bundle is shared by all of them. Each output row has
+``career_1..k`` and ``probability_1..k``, plus an ``error`` column that
+names the invalid fields of rows that could not be scored.
+
+At most two chunks per worker are in flight, and results are appended to
+the output CSV in input order as they complete, so memory use does not grow
+with the input. After every chunk a ``<output>.checkpoint.json`` records the
+rows written and the output's byte length. A rerun with the same input,
+model and options truncates the output to that length and resumes after the
+last complete chunk; ``--restart`` starts over instead. The checkpoint is
+removed when the run completes. Missing feature or ``--id-column`` columns
+are reported before anything is scored.
+
+Parquet input needs pyarrow. The output is always CSV, which can be appended
+and truncated.
+
+Usage:
+    python batch_score.py students.csv predictions.csv --workers 4 --top-k 3 --id-column student_id
+"""
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from career_ranking import DEFAULT_TOP_K, rank_matrix
+from career_schema import CAREER_LABELS, encode_valid_rows, load_career_model, match_columns
+from forest_engine import default_model_path
+from model_store import file_sha256
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for Parquet input
+    pq = None
+
+DEFAULT_CHUNK_ROWS = 10000
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+# Per-worker model, opened once by the pool initializer
+_model = None
+
+
+def _init_worker(model_path):
+    global _model
+    _model = load_career_model(model_path)
+
+
+def result_columns(k):
+    """The columns score_frame writes besides the id columns, which must not reuse these names."""
+    return ["row"] + [f"{name}_{j + 1}" for j in range(k) for name in ("career", "probability")] + ["error"]
+
+
+def score_frame(model, frame, first_row, k, id_columns=()):
+    """Top-k predictions for one chunk as a DataFrame, one row per input row."""
+    X, errors = encode_valid_rows(frame)
+    valid = errors == ""
+    out = pd.DataFrame({"row": np.arange(first_row, first_row + len(frame))})
+    for column in id_columns:
+        out[column] = frame[column].to_numpy()
+    if X.shape[0]:
+        labels, probabilities = rank_matrix(model.predict_proba(X), model.classes_, k)
+    names = np.asarray(CAREER_LABELS, dtype=object)
+    for j in range(k):
+        career = np.full(len(frame), "", dtype=object)
+        probability = np.full(len(frame), np.nan)
+        if X.shape[0]:
+            career[valid] = names[labels[:, j]]
+            probability[valid] = probabilities[:, j]
+        out[f"career_{j + 1}"] = career
+        out[f"probability_{j + 1}"] = probability
+    out["error"] = errors
+    return out
+
+
+def _score_chunk(frame, first_row, k, id_columns, header):
+    out = score_frame(_model, frame, first_row, k, id_columns)
+    return out.to_csv(index=False, header=header, float_format="%.4f").encode()
+
+
+def _is_parquet(path):
+    if not path.lower().endswith((".parquet", ".pq")):
+        return False
+    if pq is None:
+        raise SystemExit("Reading Parquet needs pyarrow (pip install pyarrow).")
+    return True
+
+
+def check_columns(path, id_columns=(), k=DEFAULT_TOP_K):
+    """Raises ValueError unless the input has every feature column and every ``id_columns`` entry."""
+    columns = pq.ParquetFile(path).schema_arrow.names if _is_parquet(path) else pd.read_csv(path, nrows=0).columns
+    match_columns(columns)
+    missing = [column for column in id_columns if column not in columns]
+    if missing:
+        raise ValueError(f"Missing id columns: {', '.join(missing)}.")
+    clashes = [column for column in id_columns if column in result_columns(k)]
+    if clashes:
+        raise ValueError(f"Id columns {', '.join(clashes)} have the same name as a result column.")
+
+
+def iter_chunks(path, chunk_rows, skip_rows=0):
+    """Yields DataFrames of at most ``chunk_rows`` rows, after the first ``skip_rows``.
+
+    Rows are counted by the reader, not by line, so a quoted field spanning
+    several lines never shifts where a resumed run starts.
+    """
+    if _is_parquet(path):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            if skip_rows >= batch.num_rows:
+                skip_rows -= batch.num_rows
+                continue
+            yield batch.slice(skip_rows).to_pandas()
+            skip_rows = 0
+    else:
+        for frame in pd.read_csv(path, chunksize=chunk_rows):
+            if skip_rows >= len(frame):
+                skip_rows -= len(frame)
+                continue
+            yield frame.iloc[skip_rows:]
+            skip_rows = 0
+
+
+def _input_identity(path):
+    st = os.stat(path)
+    return {"input": os.path.abspath(path), "input_size": st.st_size, "input_mtime_ns": st.st_mtime_ns}
+
+
+def _load_checkpoint(checkpoint_path, expected):
+    """Returns (rows_done, output_bytes) of a matching checkpoint, else (0, 0)."""
+    try:
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return 0, 0
+    if any(checkpoint.get(key) != value for key, value in expected.items()):
+        print("Checkpoint is for a different input, model or options; starting over.", file=sys.stderr)
+        return 0, 0
+    return checkpoint["rows_done"], checkpoint["output_bytes"]
+
+
+def _save_checkpoint(checkpoint_path, state):
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def score_file(input_path, output_path, model_path, k=DEFAULT_TOP_K, id_columns=(),
+               chunk_rows=DEFAULT_CHUNK_ROWS, workers=None, restart=False):
+    """Scores ``input_path`` into ``output_path``; returns (rows scored in this run, seconds).
+
+    Raises ValueError before scoring anything if a feature or id column is missing.
+    """
+    check_columns(input_path, id_columns, k)
+    checkpoint_path = output_path + CHECKPOINT_SUFFIX
+    expected = {
+        **_input_identity(input_path),
+        "model_sha256": file_sha256(model_path),
+        "k": k,
+        "id_columns": list(id_columns),
+        "chunk_rows": chunk_rows,
+    }
+    rows_done, output_bytes = (0, 0) if restart else _load_checkpoint(checkpoint_path, expected)
+    if rows_done and (not os.path.exists(output_path) or os.path.getsize(output_path) < output_bytes):
+        print("Output is shorter than its checkpoint; starting over.", file=sys.stderr)
+        rows_done, output_bytes = 0, 0
+    if rows_done:
+        print(f"Resuming after row {rows_done:,}.", file=sys.stderr)
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    start = time.perf_counter()
+    scored = 0
+
+    with open(output_path, "ab") as out:
+        out.truncate(output_bytes)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path,)) as pool:
+            pending = collections.deque()
+
+            def write_next():
+                nonlocal rows_done, scored
+                future, n_rows = pending.popleft()
+                out.write(future.result())
+                out.flush()
+                rows_done += n_rows
+                scored += n_rows
+                _save_checkpoint(checkpoint_path, {**expected, "rows_done": rows_done, "output_bytes": out.tell()})
+                elapsed = time.perf_counter() - start
+                print(f"\r{rows_done:,} rows  {scored / elapsed:,.0f} rows/s", end="", file=sys.stderr)
+
+            first_row = rows_done
+            for frame in iter_chunks(input_path, chunk_rows, skip_rows=rows_done):
+                pending.append((pool.submit(_score_chunk, frame, first_row, k, id_columns, first_row == 0), len(frame)))
+                first_row += len(frame)
+                while len(pending) >= max_in_flight:
+                    write_next()
+            while pending:
+                write_next()
+
+    print(file=sys.stderr)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return scored, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file of student profiles.")
+    parser.add_argument("input", help="CSV or Parquet file with one column per feature")
+    parser.add_argument("output", help="CSV file to write")
+    parser.add_argument("--model", default=None, help="bundle manifest or pickled forest (default: as the app)")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--id-column", action="append", default=[], help="input column copied to the output")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--restart", action="store_true", help="ignore any checkpoint and start over")
+    args = parser.parse_args()
+
+    try:
+        scored, seconds = score_file(
+            args.input, args.output, args.model or default_model_path(), args.top_k,
+            args.id_column, args.chunk_rows, args.workers, args.restart,
+        )
+    except ValueError as e:
+        raise SystemExit(f"{args.input}: {e}") from None
+    print(f"Scored {scored:,} rows in {seconds:.1f}s ({scored / max(seconds, 1e-9):,.0f} rows/s) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Content-addressed cache for the training pipeline's artifacts.
+
+Every artifact is stored under the SHA-256 of the inputs that determine it:
+a dataset under a hash of the feature list, careers, rule table, sample count
+and seed, and a model under a hash of its dataset key and hyperparameters. A
+rerun with unchanged inputs finds both and does no work; changing only the
+hyperparameters reuses the cached dataset and retrains just the model.
+
+Entries are written to a temporary name and renamed into place, so an
+interrupted build never leaves a half-written entry behind.
+
+Layout:
+    .build_cache/datasets/<key>/X.npy, y.npy
+    .build_cache/models/<key>.pkl
+"""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = ".build_cache"
+
+
+def content_key(**parts):
+    """SHA-256 of the canonical JSON encoding of ``parts``."""
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class BuildCache:
+    def __init__(self, root=DEFAULT_CACHE_DIR):
+        self.root = root
+
+    def dataset_dir(self, key):
+        return os.path.join(self.root, "datasets", key)
+
+    def model_path(self, key):
+        return os.path.join(self.root, "models", f"{key}.pkl")
+
+    def load_dataset(self, key):
+        """Returns the cached (X, y) memory-mapped, or None on a miss."""
+        path = self.dataset_dir(key)
+        if not os.path.isdir(path):
+            return None
+        return (
+            np.load(os.path.join(path, "X.npy"), mmap_mode="r"),
+            np.load(os.path.join(path, "y.npy"), mmap_mode="r"),
+        )
+
+    def store_dataset(self, key, X, y):
+        parent = os.path.join(self.root, "datasets")
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        np.save(os.path.join(tmp_dir, "X.npy"), X)
+        np.save(os.path.join(tmp_dir, "y.npy"), y)
+        try:
+            os.rename(tmp_dir, self.dataset_dir(key))
+        except OSError:
+            # Another build stored the same key first; the contents are identical.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return self.dataset_dir(key)
+
+    def has_model(self, key):
+        return os.path.exists(self.model_path(key))
+
+    def load_model(self, key):
+        with open(self.model_path(key), "rb") as f:
+            return pickle.load(f)
+
+    def store_model(self, key, model):
+        path = self.model_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(model, f)
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,115 @@
+"""Classroom bulk upload for the Streamlit app.
+
+Teachers upload a roster instead of moving 45 sliders per student. The file
+is a CSV (or Parquet, with pyarrow) with one row per student and one column
+per question, named as in the downloadable template. Every other column,
+such as a student name or id, is carried through to the results, unless it
+is named like a result column (``row``, ``career_1``, ``error``, ...); such
+a roster is refused with a message rather than mixing the two. The roster
+is validated against the feature schema before scoring, and invalid rows are
+listed and skipped rather than failing the whole upload.
+
+The section is an st.fragment, so uploading a file or pressing its button
+reruns only this section. Scoring reuses batch_score.score_frame. Each
+chunk of ``BULK_CHUNK_ROWS`` rows is one vectorized ``predict_proba`` call,
+so a 500-student roster takes a handful of calls. The progress bar and
+results table update after every chunk, and the finished table can be
+downloaded as CSV.
+"""
+import io
+
+import pandas as pd
+import streamlit as st
+
+from app_state import load_app_model
+from batch_score import result_columns, score_frame
+from career_schema import FEATURE_NAMES, frame_errors, match_columns
+
+# Rows scored per call; small enough for the progress bar to move on class-sized rosters.
+BULK_CHUNK_ROWS = 100
+# Invalid rows listed before scoring
+MAX_ERRORS_SHOWN = 20
+
+
+def roster_template():
+    """A one-row example roster, as CSV bytes."""
+    example = {"Student": "Example Student", "Age": 16}
+    example.update({name: 3 for name in FEATURE_NAMES[1:-5]})
+    example.update({name: "Yes" for name in FEATURE_NAMES[-5:]})
+    return pd.DataFrame([example]).to_csv(index=False).encode()
+
+
+def read_roster(uploaded_file):
+    """Reads an uploaded CSV or Parquet roster into a DataFrame."""
+    data = uploaded_file.getvalue()
+    if uploaded_file.name.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data))
+
+
+@st.fragment
+def render_bulk_upload(k=3):
+    """The classroom upload section, rerun on its own: validate, score in chunks, download."""
+    st.markdown("### 🏫 Classroom Bulk Upload")
+    st.markdown("*Score a whole class at once: one row per student, one column per question.*")
+    st.download_button(
+        "📄 Download roster template", roster_template(), file_name="career_pulse_roster.csv", mime="text/csv"
+    )
+
+    uploaded = st.file_uploader("Upload class roster", type=["csv", "parquet"], key="bulk_roster")
+    if uploaded is None:
+        return
+
+    try:
+        frame = read_roster(uploaded)
+        feature_columns = match_columns(frame.columns)
+    except Exception as e:
+        st.error(f"❗ Could not read this roster: {e}")
+        return
+    id_columns = [column for column in frame.columns if column not in set(feature_columns)]
+    clashes = [str(column) for column in id_columns if column in result_columns(k)]
+    if clashes:
+        st.error(f"❗ Please rename these columns; the results table uses the same names: {', '.join(clashes)}")
+        return
+
+    errors = frame_errors(frame)
+    invalid = errors != ""
+    st.info(f"📋 {len(frame)} students found, {int(invalid.sum())} with invalid answers.")
+    if invalid.any():
+        st.warning("⚠️ These rows will be skipped until they are fixed:")
+        st.dataframe(
+            pd.DataFrame({"row": frame.index[invalid], "error": errors[invalid]}).head(MAX_ERRORS_SHOWN),
+            hide_index=True,
+        )
+
+    results_key = f"bulk_results_{uploaded.file_id}"
+    if st.button("🔍 Score Class Roster", type="primary"):
+        # Fetched here, not passed in, so a swapped model is used (see load_app_model).
+        # Scores through the ranker's backend (batcher / workers) when one is configured.
+        _, model, ranker = load_app_model(show_errors=False)
+        if ranker is not None:
+            model = ranker.model
+        progress = st.progress(0.0, text="Scoring roster...")
+        table = st.empty()
+        parts = []
+        try:
+            for start in range(0, len(frame), BULK_CHUNK_ROWS):
+                parts.append(score_frame(model, frame.iloc[start : start + BULK_CHUNK_ROWS], start, k, id_columns))
+                done = min(start + BULK_CHUNK_ROWS, len(frame))
+                progress.progress(done / len(frame), text=f"Scored {done} of {len(frame)} students")
+                table.dataframe(pd.concat(parts, ignore_index=True), hide_index=True)
+        except Exception as e:
+            st.error(f"❗ An error occurred during prediction: {e}")
+            return
+        st.session_state[results_key] = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        progress.empty()
+    elif results_key in st.session_state:
+        st.dataframe(st.session_state[results_key], hide_index=True)
+
+    if results_key in st.session_state:
+        st.download_button(
+            "⬇️ Download results (CSV)",
+            st.session_state[results_key].to_csv(index=False).encode(),
+            file_name="career_pulse_results.csv",
+            mime="text/csv",
+        )
@@ -0,0 +1,291 @@
+"""Career labels and the details shown for each career.
+
+Shared by the Streamlit app and the prediction service. ``CAREER_OPTIONS``
+is every career the explorer can show: the model's classes
+(career_schema.CAREER_LABELS, so a predicted class index is also an index
+into this list), followed by careers the model cannot predict yet.
+"""
+from career_schema import CAREER_LABELS
+
+CAREER_OPTIONS = CAREER_LABELS + [
+    "Cybersecurity Analyst", "AI Research Scientist", "Entrepreneur", "Psychologist", "Astronaut",
+    "Biotechnologist", "Game Developer", "Robotics Engineer", "Economist", "Chef",
+    "Pilot", "Social Worker"
+]
+
+CAREER_INFO = {
+    "Software Engineer": {
+        "description": "Designs, develops, tests, and maintains software systems.",
+        "skills": ["Programming", "Problem-solving", "Teamwork"],
+        "education": "Bachelor's degree in Computer Science or related field",
+        "salary": "$80,000 - $150,000",
+        "outlook": "High growth potential",
+    },
+    "Data Scientist": {
+        "description": "Analyzes complex data to extract insights and inform business decisions.",
+        "skills": ["Data analysis", "Machine learning", "Statistics"],
+        "education": "Bachelor's or Master's degree in a quantitative field",
+        "salary": "$90,000 - $170,000",
+        "outlook": "Very high growth potential",
+    },
+    "Web Developer": {
+        "description": "Creates and maintains websites and web applications.",
+        "skills": ["HTML", "CSS", "JavaScript", "Frameworks"],
+        "education": "Bachelor's degree in Computer Science or related field, or relevant certifications",
+        "salary": "$60,000 - $120,000",
+        "outlook": "Good growth potential",
+    },
+    "Graphic Designer": {
+        "description": "Creates visual concepts to communicate ideas.",
+        "skills": ["Adobe Creative Suite", "Typography", "Visual Communication"],
+        "education": "Bachelor's degree in Graphic Design or related field",
+        "salary": "$40,000 - $80,000",
+        "outlook": "Moderate growth potential",
+    },
+    "UX/UI Designer": {
+        "description": "Enhances user satisfaction by improving the usability, accessibility, and pleasure provided in the interaction between the user and the product.",
+        "skills": ["User Research", "Wireframing", "Prototyping", "Visual Design"],
+        "education": "Bachelor's degree in Design, HCI, or related field",
+        "salary": "$70,000 - $130,000",
+        "outlook": "High growth potential",
+    },
+    "Marketing Manager": {
+        "description": "Plans and executes marketing campaigns to increase brand awareness and sales.",
+        "skills": ["Marketing Strategy", "Communication", "Data Analysis", "Leadership"],
+        "education": "Bachelor's degree in Marketing or related field",
+        "salary": "$70,000 - $140,000",
+        "outlook": "Stable growth potential",
+    },
+    "Financial Analyst": {
+        "description": "Provides guidance to businesses and individuals in making decisions regarding their investments.",
+        "skills": ["Financial Modeling", "Data Analysis", "Accounting", "Communication"],
+        "education": "Bachelor's degree in Finance, Economics, or related field",
+        "salary": "$65,000 - $120,000",
+        "outlook": "Moderate growth potential",
+    },
+    "Product Manager": {
+        "description": "Responsible for the strategy, roadmap, and feature definition of a product.",
+        "skills": ["Product Strategy", "Market Research", "Communication", "Project Management"],
+        "education": "Bachelor's degree in Business, Engineering, or related field",
+        "salary": "$80,000 - $150,000",
+        "outlook": "High growth potential",
+    },
+    "Business Analyst": {
+        "description": "Identifies business needs and determines solutions to business problems.",
+        "skills": ["Data Analysis", "Business Process Modeling", "Communication", "Problem Solving"],
+        "education": "Bachelor's degree in Business, Economics, or related field",
+        "salary": "$70,000 - $130,000",
+        "outlook": "Stable growth potential",
+    },
+    "Human Resources Manager": {
+        "description": "Recruits, hires, and manages employees; handles employee relations and benefits.",
+        "skills": ["Communication", "Interpersonal Skills", "HR Knowledge", "Leadership"],
+        "education": "Bachelor's degree in Human Resources or related field",
+        "salary": "$60,000 - $110,000",
+        "outlook": "Stable growth potential",
+    },
+    "Teacher (Primary)": {
+        "description": "Educates young children in various subjects to foster their intellectual and social development.",
+        "skills": ["Communication", "Patience", "Classroom Management", "Creativity"],
+        "education": "Bachelor's degree in Education",
+        "salary": "$45,000 - $75,000",
+        "outlook": "Stable growth potential",
+    },
+    "Teacher (Secondary)": {
+        "description": "Instructs students in specific subjects within a secondary education setting, preparing them for higher education or careers.",
+        "skills": ["Subject Matter Expertise", "Communication", "Classroom Management", "Mentoring"],
+        "education": "Bachelor's degree in Education with subject specialization",
+        "salary": "$48,000 - $80,000",
+        "outlook": "Stable growth potential",
+    },
+    "Professor": {
+        "description": "Conducts research and teaches undergraduate or graduate level courses in a specialized field of study.",
+        "skills": ["Research", "Teaching", "Communication", "Subject Matter Expertise"],
+        "education": "Doctoral degree in a specialized field",
+        "salary": "$80,000 - $150,000",
+        "outlook": "Moderate growth potential",
+    },
+    "Doctor (General)": {
+        "description": "Diagnoses and treats a variety of medical conditions and injuries in patients.",
+        "skills": ["Medical Knowledge", "Diagnostic Skills", "Communication", "Empathy"],
+        "education": "Doctor of Medicine (MD) degree",
+        "salary": "$180,000 - $250,000",
+        "outlook": "High growth potential",
+    },
+    "Doctor (Specialist)": {
+        "description": "Provides specialized medical care in a specific area of medicine, such as cardiology or oncology.",
+        "skills": ["Specialized Medical Knowledge", "Advanced Clinical Skills", "Communication", "Problem Solving"],
+        "education": "Doctor of Medicine (MD) degree with specialty training",
+        "salary": "$250,000 - $400,000+",
+        "outlook": "High growth potential",
+    },
+    "Nurse": {
+        "description": "Provides and coordinates patient care, educates patients and the public about various health conditions, and provide advice and emotional support to patients and their family members.",
+        "skills": ["Patient Care", "Communication", "Critical Thinking", "Empathy"],
+        "education": "Bachelor of Science in Nursing (BSN) or Associate's Degree in Nursing (ADN)",
+        "salary": "$60,000 - $90,000",
+        "outlook": "High growth potential",
+    },
+    "Pharmacist": {
+        "description": "Dispenses medications, ensures drug safety and efficacy, and provides pharmaceutical care to patients.",
+        "skills": ["Pharmaceutical Knowledge", "Communication", "Attention to Detail", "Customer Service"],
+        "education": "Doctor of Pharmacy (PharmD) degree",
+        "salary": "$120,000 - $150,000",
+        "outlook": "Stable growth potential",
+    },
+    "Lawyer": {
+        "description": "Represents clients in legal proceedings, advises them on their legal rights and obligations, and draws up legal documents.",
+        "skills": ["Legal Knowledge", "Communication", "Critical Thinking", "Negotiation"],
+        "education": "Juris Doctor (JD) degree",
+        "salary": "$80,000 - $200,000+",
+        "outlook": "Moderate growth potential",
+    },
+    "Journalist": {
+        "description": "Investigates and reports on news and current events for publication or broadcast.",
+        "skills": ["Writing", "Research", "Interviewing", "Communication"],
+        "education": "Bachelor's degree in Journalism or related field",
+        "salary": "$40,000 - $70,000",
+        "outlook": "Declining growth potential",
+    },
+    "Technical Writer": {
+        "description": "Creates technical documentation, such as user manuals, help guides, and API documentation.",
+        "skills": ["Writing", "Technical Knowledge", "Communication", "Attention to Detail"],
+        "education": "Bachelor's degree in English, Technical Writing, or related field",
+        "salary": "$60,000 - $100,000",
+        "outlook": "Stable growth potential",
+    },
+    "Architect": {
+        "description": "Designs buildings and other structures, considering both their form and function.",
+        "skills": ["Design", "Technical Knowledge", "Communication", "Creativity"],
+        "education": "Bachelor's or Master's degree in Architecture",
+        "salary": "$70,000 - $140,000",
+        "outlook": "Moderate growth potential",
+    },
+    "Civil Engineer": {
+        "description": "Designs and oversees the construction of infrastructure projects, such as roads, bridges, and dams.",
+        "skills": ["Engineering Knowledge", "Project Management", "Problem Solving", "Technical Skills"],
+        "education": "Bachelor's degree in Civil Engineering",
+        "salary": "$70,000 - $130,000",
+        "outlook": "Stable growth potential",
+    },
+    "Mechanical Engineer": {
+        "description": "Designs, develops, tests, and manufactures mechanical devices and systems.",
+        "skills": ["Engineering Knowledge", "Design", "Problem Solving", "Technical Skills"],
+        "education": "Bachelor's degree in Mechanical Engineering",
+        "salary": "$70,000 - $130,000",
+        "outlook": "Stable growth potential",
+    },
+    "Electrical Engineer": {
+        "description": "Designs, develops, tests, and supervises the manufacturing of electrical equipment.",
+        "skills": ["Engineering Knowledge", "Electrical Systems Design", "Problem Solving", "Technical Skills"],
+        "education": "Bachelor's degree in Electrical Engineering",
+        "salary": "$75,000 - $140,000",
+        "outlook": "Stable growth potential",
+    },
+    "Environmental Scientist": {
+        "description": "Studies environmental problems and develops solutions to protect the environment and human health.",
+        "skills": ["Environmental Science Knowledge", "Research", "Data Analysis", "Problem Solving"],
+        "education": "Bachelor's or Master's degree in Environmental Science or related field",
+        "salary": "$60,000 - $110,000",
+        "outlook": "Good growth potential",
+    },
+    "Data Analyst": {
+        "description": "Collects, processes, and performs statistical analysis of data.",
+        "skills": ["Data Analysis", "Statistics", "Data Visualization", "Database Knowledge"],
+        "education": "Bachelor's degree in Mathematics, Statistics, Computer Science, or related field",
+        "salary": "$60,000 - $100,000",
+        "outlook": "High growth potential",
+    },
+    "Management Consultant": {
+        "description": "Advises top management on how to improve the organization's efficiency and effectiveness.",
+        "skills": ["Analytical thinking", "Communication", "Problem-solving"],
+        "education": "Bachelor's degree in business or a related field",
+        "salary": "$85,000 - $160,000",
+        "outlook": "Growing",
+    },
+        "Cybersecurity Analyst": {
+        "description": "Protects systems and networks from cyber threats and attacks.",
+        "skills": ["Cybersecurity", "Problem-solving", "Risk Analysis"],
+        "education": "Bachelor's in Cybersecurity, Computer Science or related field",
+        "salary": "$85,000 - $160,000",
+        "outlook": "High growth potential",
+    },
+    "AI Research Scientist": {
+        "description": "Conducts research to advance artificial intelligence and machine learning algorithms.",
+        "skills": ["Machine Learning", "Mathematics", "Programming", "Research"],
+        "education": "PhD in Computer Science, AI, or related field",
+        "salary": "$120,000 - $200,000",
+        "outlook": "Very high growth potential",
+    },
+    "Entrepreneur": {
+        "description": "Starts and manages businesses, taking on financial risks in the hope of profit.",
+        "skills": ["Leadership", "Business Strategy", "Creativity", "Networking"],
+        "education": "No fixed requirement, often Business/Management degrees",
+        "salary": "Highly variable",
+        "outlook": "High growth potential",
+    },
+    "Psychologist": {
+        "description": "Studies mental processes and behavior, provides therapy and counseling.",
+        "skills": ["Empathy", "Research", "Communication", "Critical Thinking"],
+        "education": "Master’s or Doctoral degree in Psychology",
+        "salary": "$70,000 - $130,000",
+        "outlook": "Stable growth potential",
+    },
+    "Astronaut": {
+        "description": "Trains and travels into space to conduct research and exploration.",
+        "skills": ["Physical Fitness", "Engineering Knowledge", "Problem-solving", "Teamwork"],
+        "education": "Bachelor’s or Master’s in Engineering, Science, or Aviation; advanced training",
+        "salary": "$100,000 - $160,000+",
+        "outlook": "Very limited but prestigious",
+    },
+    "Biotechnologist": {
+        "description": "Applies biology and technology to develop products in medicine, agriculture, and environment.",
+        "skills": ["Biology", "Research", "Lab Skills", "Data Analysis"],
+        "education": "Bachelor's or Master's in Biotechnology or related field",
+        "salary": "$65,000 - $120,000",
+        "outlook": "High growth potential",
+    },
+    "Game Developer": {
+        "description": "Designs and builds interactive video games for consoles, PCs, and mobile devices.",
+        "skills": ["Programming", "Game Engines", "Creativity", "3D Modeling"],
+        "education": "Bachelor's in Computer Science, Game Design or related field",
+        "salary": "$60,000 - $120,000",
+        "outlook": "Growing rapidly",
+    },
+    "Robotics Engineer": {
+        "description": "Designs and develops robots and automated systems.",
+        "skills": ["Mechanical Engineering", "Electronics", "Programming", "Problem-solving"],
+        "education": "Bachelor’s or Master’s in Robotics, Mechanical or Electrical Engineering",
+        "salary": "$80,000 - $140,000",
+        "outlook": "High growth potential",
+    },
+    "Economist": {
+        "description": "Studies resource allocation, economic trends, and advises governments or businesses.",
+        "skills": ["Economics", "Data Analysis", "Research", "Critical Thinking"],
+        "education": "Master’s or PhD in Economics",
+        "salary": "$75,000 - $140,000",
+        "outlook": "Stable growth potential",
+    },
+    "Chef": {
+        "description": "Prepares meals, designs menus, and manages kitchen staff.",
+        "skills": ["Cooking", "Creativity", "Time Management", "Teamwork"],
+        "education": "Culinary Arts degree or apprenticeship",
+        "salary": "$40,000 - $100,000",
+        "outlook": "Good growth potential",
+    },
+    "Pilot": {
+        "description": "Operates aircraft to transport passengers or cargo.",
+        "skills": ["Navigation", "Decision-making", "Communication", "Technical Knowledge"],
+        "education": "Commercial Pilot License (CPL) and specialized training",
+        "salary": "$80,000 - $200,000",
+        "outlook": "High demand in aviation",
+    },
+    "Social Worker": {
+        "description": "Helps individuals and communities with social, emotional, and economic challenges.",
+        "skills": ["Empathy", "Communication", "Problem-solving", "Counseling"],
+        "education": "Bachelor’s or Master’s in Social Work",
+        "salary": "$45,000 - $75,000",
+        "outlook": "Stable growth potential",
+    },
+
+}
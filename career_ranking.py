@@ -0,0 +1,235 @@
+"""Top-k career ranking with a memo of recent profiles.
+
+The app used to show only ``model.predict(x)[0]``. ``CareerRanker.top_k``
+instead runs one ``predict_proba`` pass and returns the k most likely careers
+with their probabilities: the share of the forest's vote each one received.
+``top_k(x, 1)`` is always ``predict(x)``, since ties go to the lower class
+index like ``np.argmax``. ``best_match`` returns that same class from the
+early-exit vote, for the questionnaire's live preview.
+
+Many students submit the same profile, for example the questionnaire defaults
+or the same classroom exercise. Rankings are therefore kept in a bounded LRU
+cache keyed by the profile packed into 45 bytes, one per feature, and a
+repeated profile is answered without touching the model. A ranker belongs to
+one model version, and ``get_ranker`` starts a fresh ranker and cache when
+the ModelHolder swaps in a new version.
+
+Behind the in-process LRU a ranker can also consult a SharedPredictionCache
+(prediction_cache.py), which every process on the host shares. If the shared
+cache fails, the ranker logs the error and scores the profile itself. Cache
+misses can also go through a MicroBatcher (prediction_scheduler.py), which
+merges concurrent sessions' rows into one ``predict_proba`` call, and/or a
+PredictionWorkerPool (prediction_workers.py), which scores them in worker
+processes.
+"""
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from prediction_cache import SharedPredictionCache
+from prediction_scheduler import MicroBatcher
+from prediction_workers import PredictionWorkerPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 3
+DEFAULT_CACHE_SIZE = 4096
+
+
+def pack_profile(x):
+    """Packs one profile of small non-negative integers into bytes."""
+    x = np.asarray(x).reshape(-1)
+    packed = x.astype(np.uint8)
+    if not np.array_equal(packed, x):
+        raise ValueError("Profiles must hold integers between 0 and 255 to be packed.")
+    return packed.tobytes()
+
+
+class LRUCache:
+    """A thread-safe mapping that keeps the ``maxsize`` most recently used entries."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def rank_proba(proba, classes, k=DEFAULT_TOP_K):
+    """The ``k`` highest (class, probability) pairs of one probability row."""
+    order = np.argsort(-proba, kind="stable")[:k]
+    return tuple((classes[i].item(), float(proba[i])) for i in order)
+
+
+def rank_matrix(proba, classes, k=DEFAULT_TOP_K):
+    """Top ``k`` classes and probabilities of every row, each shaped (n_rows, k)."""
+    order = np.argsort(-proba, axis=1, kind="stable")[:, :k]
+    return np.asarray(classes).take(order), np.take_along_axis(proba, order, axis=1)
+
+
+class CareerRanker:
+    """Memoized top-k rankings from a model with ``predict_proba``."""
+
+    def __init__(self, model, cache_size=DEFAULT_CACHE_SIZE, shared=None, version=None):
+        self.model = model
+        self.version = version  # the ModelVersion it scores, when built by get_ranker
+        self.classes = np.asarray(model.classes_)
+        self.cache = LRUCache(cache_size)
+        self.shared = shared
+
+    def top_k(self, x, k=DEFAULT_TOP_K):
+        """Returns ``((class, probability), ...)`` for the ``k`` best classes."""
+        key = pack_profile(x)
+        ranking = self.cache.get(key)
+        if ranking is None:
+            ranking = self._shared_get(key)
+            if ranking is None:
+                proba = self.model.predict_proba(np.asarray(x).reshape(1, -1))[0]
+                # Rank every class once so any k up to n_classes is served from the cache.
+                ranking = rank_proba(proba, self.classes, len(self.classes))
+                self._shared_put(key, ranking)
+            self.cache.put(key, ranking)
+        return ranking[:k]
+
+    def best_match(self, x):
+        """The class ``top_k(x, 1)`` would return, without computing probabilities.
+
+        A profile that is already ranked is answered from the cache. Otherwise
+        the in-process forest votes with ``predict_early_exit``, which stops
+        once the leader can no longer be overtaken. It is cheap enough for
+        the calling thread, so no batcher or worker is involved.
+        """
+        ranking = self.cache.get(pack_profile(x))
+        if ranking is not None:
+            return ranking[0][0]
+        engine = getattr(self.version, "model", None)
+        if not hasattr(engine, "predict_early_exit"):
+            return self.top_k(x, 1)[0][0]
+        labels, _ = engine.predict_early_exit(np.asarray(x).reshape(1, -1))
+        return labels[0].item()
+
+    def _shared_get(self, key):
+        if self.shared is None:
+            return None
+        try:
+            return self.shared.get(key)
+        except sqlite3.Error:
+            logger.exception("Reading the shared prediction cache %s failed", self.shared.path)
+            return None
+
+    def _shared_put(self, key, ranking):
+        if self.shared is None:
+            return
+        try:
+            self.shared.put(key, ranking)
+        except sqlite3.Error:
+            logger.exception("Writing the shared prediction cache %s failed", self.shared.path)
+
+
+_ranker = None
+# Held while a ranker is built; other sessions keep the current one meanwhile
+_ranker_lock = threading.Lock()
+# Seconds a replaced ranker's scorers keep serving, for sessions that fetched it just before the swap
+RETIRE_GRACE = 10.0
+
+
+def _close_scorers(model):
+    while isinstance(model, (MicroBatcher, PredictionWorkerPool)):
+        model.close()
+        model = getattr(model, "model", None)
+
+
+def _retire_scorers(model):
+    """Closes a replaced ranker's scorers after RETIRE_GRACE; each close drains its requests in flight."""
+    timer = threading.Timer(RETIRE_GRACE, _close_scorers, args=(model,))
+    timer.daemon = True
+    timer.start()
+
+
+def model_identity(model_version):
+    """The pickled forest's SHA-256, for a pickle or for a bundle exported from it."""
+    manifest = getattr(getattr(model_version.model, "forest", None), "manifest", None) or {}
+    return manifest.get("source_sha256") or model_version.sha256
+
+
+def _build_ranker(model_version, cache_size, shared_path, micro_batch_wait, workers):
+    model = model_version.model
+    if workers:
+        try:
+            model = PredictionWorkerPool(
+                model_version.path, workers, sha256=model_version.sha256, model=model_version.model
+            )
+        except RuntimeError:
+            # For example the artifact changed again while the workers started
+            logger.exception("Starting prediction workers for model %s failed; scoring in-process", model_version.tag)
+    if micro_batch_wait:
+        model = MicroBatcher(model, max_wait=micro_batch_wait)
+    shared = None
+    if shared_path:
+        try:
+            shared = SharedPredictionCache(shared_path, model_identity(model_version))
+        except sqlite3.Error:
+            logger.exception("Opening the shared prediction cache %s failed", shared_path)
+    return CareerRanker(model, cache_size, shared, model_version)
+
+
+def get_ranker(model_version, cache_size=DEFAULT_CACHE_SIZE, shared_path=None, micro_batch_wait=None, workers=None):
+    """Returns the process-wide ranker for ``model_version`` (a ModelVersion).
+
+    With ``shared_path`` the ranker also uses the host-wide SQLite cache there.
+    With ``workers`` its misses are scored by that many worker processes, and
+    with ``micro_batch_wait`` (seconds) they are first gathered into batches.
+
+    Starting workers takes seconds, so while one thread builds the ranker for
+    a new version, other callers keep getting the current one; its
+    ``version`` says which model it scores. The replaced
+    ranker's scorers are closed RETIRE_GRACE seconds later, after the
+    predictions they are running have finished. A caller that still holds
+    the replaced ranker after that is scored in-process by its version's
+    model, never refused.
+    """
+    global _ranker
+    current = _ranker
+    if current is not None and current[0] == model_version.sha256:
+        return current[1]
+    if not _ranker_lock.acquire(blocking=current is None):
+        return current[1]
+    try:
+        current = _ranker
+        if current is not None and current[0] == model_version.sha256:
+            return current[1]
+        ranker = _build_ranker(model_version, cache_size, shared_path, micro_batch_wait, workers)
+        _ranker = (model_version.sha256, ranker)
+    finally:
+        _ranker_lock.release()
+    if current is not None:
+        _retire_scorers(current[1].model)
+    return ranker
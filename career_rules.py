@@ -0,0 +1,270 @@
+"""Declarative career rules for the synthetic training data.
+
+Each career maps model features to the ``[low, high)`` range its samples are
+drawn from, overriding the feature's baseline range. ``compile_career_rules``
+validates the table against the feature schema and turns it into per-career
+low/high bound arrays, so the sampler draws a career's whole block with a
+single ``Generator.integers`` call however many rules it has.
+"""
+import hashlib
+import json
+
+import numpy as np
+
+CAREER_RULES = {
+    "Software Engineer": {
+        "Computer Science - Programming": (4, 6),
+        "Computer Science - Data Structures": (3, 6),
+        "Technology - Artificial Intelligence": (4, 6),
+        "Technology - Cybersecurity": (3, 6),
+        "Enjoy solving complex problems?": (1, 2),
+        "Prefer working with machines?": (1, 2),
+        "Maths - Algebra": (3, 5),
+    },
+    "Data Scientist": {
+        "Maths - Algebra": (4, 6),
+        "Computer Science - Programming": (4, 6),
+        "Technology - Artificial Intelligence": (4, 6),
+        "Enjoy solving complex problems?": (1, 2),
+        "Interested in research?": (1, 2),
+    },
+    "Web Developer": {
+        "Computer Science - Programming": (4, 6),
+        "Technology - Artificial Intelligence": (4, 6),
+        "Technology - Web Development": (3, 5),
+        "Prefer working with machines?": (1, 2),
+    },
+    "Graphic Designer": {
+        "Art - Painting": (4, 6),
+        "Art - Sculpture": (3, 6),
+        "Creativity - Visual": (4, 6),
+    },
+    "UX/UI Designer": {
+        "Computer Science - Programming": (3, 5),
+        "Creativity - Visual": (4, 6),
+        "Creativity - Innovation": (3, 5),
+        "Technology - Web Development": (3, 5),
+    },
+    "Marketing Manager": {
+        "Communication - Written": (4, 6),
+        "Communication - Verbal": (4, 6),
+        "Creativity - Innovation": (3, 6),
+        "Business - Marketing": (3, 5),
+        "Business - Management": (2, 4),
+    },
+    "Financial Analyst": {
+        "Maths - Algebra": (4, 6),
+        "Business - Finance": (4, 6),
+        "Interested in research?": (1, 2),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Product Manager": {
+        "Computer Science - Programming": (3, 5),
+        "Communication - Verbal": (3, 5),
+        "Leadership - Team Management": (3, 5),
+        "Business - Management": (3, 5),
+        "Technology - Artificial Intelligence": (3, 5),
+    },
+    "Business Analyst": {
+        "Maths - Algebra": (3, 5),
+        "Communication - Verbal": (3, 5),
+        "Business - Management": (3, 5),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Human Resources Manager": {
+        "Communication - Verbal": (4, 6),
+        "Leadership - Team Management": (4, 6),
+        "Leadership - Initiative": (3, 5),
+        "Enjoy working with people?": (1, 2),
+        "Business - Management": (3, 5),
+    },
+    "Teacher (Primary)": {
+        "Communication - Verbal": (4, 6),
+        "Education - Primary/Secondary": (4, 6),
+        "Enjoy working with people?": (1, 2),
+        "Creativity - Visual": (3, 5),
+        "History - Ancient": (3, 5),
+    },
+    "Teacher (Secondary)": {
+        "Communication - Verbal": (4, 6),
+        "Education - Primary/Secondary": (4, 6),
+        "Enjoy working with people?": (1, 2),
+        "History - Ancient": (3, 5),
+        "Computer Science - Programming": (3, 5),
+    },
+    "Professor": {
+        "Communication - Verbal": (4, 6),
+        "Education - Higher Education": (4, 6),
+        "Interested in research?": (1, 2),
+    },
+    "Doctor (General)": {
+        "Science - Biology": (4, 6),
+        "Healthcare - Clinical Research": (4, 6),
+        "Communication - Verbal": (3, 5),
+        "Enjoy working with people?": (1, 2),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Doctor (Specialist)": {
+        "Science - Biology": (4, 6),
+        "Healthcare - Clinical Research": (4, 6),
+        "Communication - Verbal": (3, 5),
+        "Enjoy working with people?": (1, 2),
+        "Interested in research?": (1, 2),
+    },
+    "Nurse": {
+        "Science - Biology": (3, 5),
+        "Healthcare - Patient Care": (4, 6),
+        "Communication - Verbal": (4, 6),
+        "Enjoy working with people?": (1, 2),
+        "Leadership - Team Management": (2, 4),
+    },
+    "Pharmacist": {
+        "Science - Chemistry": (3, 5),
+        "Healthcare - Patient Care": (4, 6),
+        "Maths - Algebra": (3, 5),
+    },
+    "Lawyer": {
+        "History - Ancient": (4, 6),
+        "Communication - Written": (4, 6),
+        "Communication - Verbal": (4, 6),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Journalist": {
+        "History - Ancient": (3, 5),
+        "Communication - Written": (4, 6),
+        "Communication - Verbal": (4, 6),
+        "Writing - Creative Writing": (4, 6),
+    },
+    "Technical Writer": {
+        "Computer Science - Programming": (3, 5),
+        "Communication - Written": (4, 6),
+        "Writing - Technical Writing": (4, 6),
+    },
+    "Architect": {
+        "Maths - Algebra": (3, 5),
+        "Art - Painting": (3, 5),
+        "Engineering - Mechanical": (3, 5),
+        "Creativity - Visual": (3, 5),
+    },
+    "Civil Engineer": {
+        "Maths - Calculus": (4, 6),
+        "Science - Physics": (3, 5),
+        "Engineering - Mechanical": (4, 6),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Mechanical Engineer": {
+        "Maths - Calculus": (4, 6),
+        "Science - Physics": (4, 6),
+        "Engineering - Mechanical": (4, 6),
+        "Prefer working with machines?": (1, 2),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Electrical Engineer": {
+        "Maths - Calculus": (4, 6),
+        "Science - Physics": (4, 6),
+        "Computer Science - Programming": (2, 4),
+        "Engineering - Electrical": (4, 6),
+        "Prefer working with machines?": (1, 2),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Environmental Scientist": {
+        "Science - Biology": (4, 6),
+        "Engineering - Mechanical": (4, 6),
+        "Interested in research?": (1, 2),
+    },
+    "Data Analyst": {
+        "Maths - Algebra": (4, 6),
+        "Computer Science - Programming": (3, 5),
+        "Problem Solving - Logical": (1, 2),
+    },
+    "Management Consultant": {
+        "Economics - Microeconomics": (3, 5),
+        "Communication - Verbal": (3, 5),
+        "Business - Management": (3, 5),
+    },
+}
+
+# Rules that pick one feature from a group per sample: a professor is strong in
+# one randomly chosen subject.
+CAREER_CHOICE_RULES = {
+    "Professor": {
+        "features": [
+            "Maths - Algebra", "Maths - Calculus", "Science - Biology", "Science - Chemistry",
+            "Science - Physics", "Computer Science - Programming", "Computer Science - Data Structures",
+        ],
+        "range": (4, 6),
+    },
+}
+
+
+class CompiledRules:
+    """Per-career sampling bounds, indexed like the career and feature lists."""
+
+    def __init__(self, low, high, choices, digest):
+        self.low = low
+        self.high = high
+        # choices[i] is a list of (feature indices, low, high) for career i
+        self.choices = choices
+        self.digest = digest
+
+
+def rules_digest(careers, feature_names, base_low, base_high, rules, choice_rules):
+    """A stable hash of everything that determines the generated data."""
+    payload = {
+        "careers": list(careers),
+        "features": list(feature_names),
+        "base_low": np.asarray(base_low).tolist(),
+        "base_high": np.asarray(base_high).tolist(),
+        "rules": rules,
+        "choice_rules": choice_rules,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _check_range(career, name, value_range, errors):
+    low, high = value_range
+    if not (isinstance(low, int) and isinstance(high, int) and -128 <= low < high <= 128):
+        errors.append(f"{career}: {name} has invalid range {value_range!r}; expected [low, high) integers")
+
+
+def compile_career_rules(careers, feature_names, base_low, base_high,
+                         rules=CAREER_RULES, choice_rules=CAREER_CHOICE_RULES):
+    """Validates the rule tables and compiles them into bound arrays.
+
+    Raises ValueError listing every rule that names an unknown career or
+    feature, or has an empty or non-integer range, instead of dropping it.
+    """
+    feature_index = {name: i for i, name in enumerate(feature_names)}
+    career_index = {name: i for i, name in enumerate(careers)}
+    errors = []
+
+    for career in list(rules) + list(choice_rules):
+        if career not in career_index:
+            errors.append(f"rule for unknown career {career!r}")
+    for career, overrides in rules.items():
+        for name, value_range in overrides.items():
+            if name not in feature_index:
+                errors.append(f"{career}: {name!r} is not a model feature")
+            _check_range(career, name, value_range, errors)
+    for career, rule in choice_rules.items():
+        for name in rule["features"]:
+            if name not in feature_index:
+                errors.append(f"{career}: {name!r} is not a model feature")
+        _check_range(career, "choice", rule["range"], errors)
+    if errors:
+        raise ValueError("Invalid career rules:\n  " + "\n  ".join(errors))
+
+    low = np.tile(np.asarray(base_low, dtype=np.int16), (len(careers), 1))
+    high = np.tile(np.asarray(base_high, dtype=np.int16), (len(careers), 1))
+    choices = [[] for _ in careers]
+    for career, overrides in rules.items():
+        i = career_index[career]
+        for name, (lo, hi) in overrides.items():
+            low[i, feature_index[name]] = lo
+            high[i, feature_index[name]] = hi
+    for career, rule in choice_rules.items():
+        indices = np.array([feature_index[name] for name in rule["features"]])
+        choices[career_index[career]].append((indices, *rule["range"]))
+
+    digest = rules_digest(careers, feature_names, base_low, base_high, rules, choice_rules)
+    return CompiledRules(low, high, choices, digest)
@@ -0,0 +1,226 @@
+"""The model's input schema and the encoder that builds its feature vectors.
+
+This is the single definition of the feature order and the career labels.
+The training script (modeltest.py), the Streamlit app, the HTTP service and
+batch scoring all import it, so none of them keep their own copy.
+
+A profile is the questionnaire as main_app collects it. It holds an age and
+four sections of answers keyed by the names shown in the app:
+``subjects``, ``skills`` and ``interests`` are 0-5 scores, and
+``preferences`` are "Yes"/"No" answers. ``encode_profile`` turns one
+profile into the model's 45-value vector in training order. Both the
+Streamlit app and the HTTP service call it, so the two paths always build
+identical vectors. The order is compiled once into ``SECTION_INDEX``, the
+column positions of each section, and ``encode_profile`` scatters each
+section's answers into a preallocated int8 row with one indexed assignment.
+
+Unknown answers are ignored. A missing or out-of-range answer raises
+ValueError naming it.
+
+Files of many profiles (one column per feature name, matched ignoring case
+and surrounding spaces) go through ``frame_errors``, which reports every
+invalid row, and ``encode_frame``/``encode_valid_rows``, which encode a whole
+DataFrame at once.
+"""
+import numpy as np
+import pandas as pd
+
+from forest_engine import load_forest_engine
+
+AGE_RANGE = (10, 55)
+SCORE_RANGE = (0, 5)
+
+SECTIONS = ("subjects", "skills", "interests", "preferences")
+
+SECTION_FEATURES = {
+    "subjects": [
+        "Maths - Algebra", "Maths - Calculus",
+        "Science - Biology", "Science - Chemistry", "Science - Physics",
+        "Computer Science - Programming", "Computer Science - Data Structures",
+        "History - Ancient", "History - Modern",
+        "Economics - Microeconomics", "Economics - Macroeconomics",
+        "Literature - Fiction", "Literature - Poetry",
+        "Art - Painting", "Art - Sculpture",
+    ],
+    "skills": [
+        "Problem Solving - Logical", "Problem Solving - Creative",
+        "Creativity - Visual", "Creativity - Innovation",
+        "Communication - Written", "Communication - Verbal",
+        "Leadership - Team Management", "Leadership - Initiative",
+    ],
+    "interests": [
+        "Technology - Artificial Intelligence", "Technology - Cybersecurity",
+        "Technology - Web Development", "Business - Marketing",
+        "Business - Finance", "Business - Management",
+        "Art And Design - Visual Arts", "Art And Design - Industrial Design",
+        "Healthcare - Clinical Research", "Healthcare - Patient Care",
+        "Education - Primary/Secondary", "Education - Higher Education",
+        "Engineering - Mechanical", "Engineering - Electrical",
+        "Writing - Creative Writing", "Writing - Technical Writing",
+    ],
+    "preferences": [
+        "Enjoy solving complex problems?",
+        "Prefer working with machines?",
+        "Interested in research?",
+        "Enjoy working with people?",
+        "Prefer working indoors?",
+    ],
+}
+
+FEATURE_NAMES = ["Age"] + [name for section in SECTIONS for name in SECTION_FEATURES[section]]
+NUM_FEATURES = len(FEATURE_NAMES)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+AGE_INDEX = FEATURE_INDEX["Age"]
+# Column positions of each section's features, in SECTION_FEATURES order
+SECTION_INDEX = {
+    section: np.array([FEATURE_INDEX[name] for name in SECTION_FEATURES[section]], dtype=np.intp)
+    for section in SECTIONS
+}
+
+# The model's classes: class i is CAREER_LABELS[i] (must match the training data)
+CAREER_LABELS = [
+    "Software Engineer", "Data Scientist", "Web Developer", "Graphic Designer",
+    "UX/UI Designer", "Marketing Manager", "Financial Analyst", "Product Manager",
+    "Business Analyst", "Human Resources Manager", "Teacher (Primary)", "Teacher (Secondary)",
+    "Professor", "Doctor (General)", "Doctor (Specialist)", "Nurse",
+    "Pharmacist", "Lawyer", "Journalist", "Technical Writer",
+    "Architect", "Civil Engineer", "Mechanical Engineer", "Electrical Engineer",
+    "Environmental Scientist", "Data Analyst", "Management Consultant"
+]
+NUM_CAREERS = len(CAREER_LABELS)
+
+_PREFERENCE_VALUES = {"yes": 1, "no": 0, "true": 1, "false": 0, "1": 1, "0": 0}
+
+
+def preference_value(answer):
+    """Maps a Yes/No answer (or a bool/0/1) to 1/0."""
+    value = _PREFERENCE_VALUES.get(str(answer).strip().lower())
+    if value is None:
+        raise ValueError(f"Expected Yes or No, got {answer!r}.")
+    return value
+
+
+def _check_range(name, value, low, high):
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or not low <= value <= high:
+        raise ValueError(f"{name} must be an integer from {low} to {high}, got {value!r}.")
+    return int(value)
+
+
+def encode_profile(age, subjects, skills, interests, preferences):
+    """Returns the int8 feature vector for one profile, in FEATURE_NAMES order."""
+    answers = {"subjects": subjects, "skills": skills, "interests": interests, "preferences": preferences}
+    for section in SECTIONS:
+        missing = [name for name in SECTION_FEATURES[section] if name not in answers[section]]
+        if missing:
+            raise ValueError(f"Missing {section} answers: {', '.join(missing)}.")
+
+    x = np.empty(NUM_FEATURES, dtype=np.int8)
+    x[AGE_INDEX] = _check_range("Age", age, *AGE_RANGE)
+    for section in ("subjects", "skills", "interests"):
+        x[SECTION_INDEX[section]] = [
+            _check_range(name, answers[section][name], *SCORE_RANGE) for name in SECTION_FEATURES[section]
+        ]
+    x[SECTION_INDEX["preferences"]] = [preference_value(preferences[name]) for name in SECTION_FEATURES["preferences"]]
+    return x
+
+
+def encode_profile_dict(profile):
+    """``encode_profile`` for a JSON-style ``{"age": ..., "subjects": {...}, ...}`` mapping."""
+    if not isinstance(profile, dict):
+        raise ValueError("A profile must be an object with age, subjects, skills, interests and preferences.")
+    missing = [key for key in ("age",) + SECTIONS if key not in profile]
+    if missing:
+        raise ValueError(f"Profile is missing {', '.join(missing)}.")
+    sections = [profile[section] for section in SECTIONS]
+    if not all(isinstance(answers, dict) for answers in sections):
+        raise ValueError("subjects, skills, interests and preferences must be objects.")
+    return encode_profile(profile["age"], *sections)
+
+
+def _feature_ranges():
+    low, high = np.empty(NUM_FEATURES, dtype=np.int64), np.empty(NUM_FEATURES, dtype=np.int64)
+    low[AGE_INDEX], high[AGE_INDEX] = AGE_RANGE
+    for section in ("subjects", "skills", "interests"):
+        low[SECTION_INDEX[section]], high[SECTION_INDEX[section]] = SCORE_RANGE
+    low[SECTION_INDEX["preferences"]], high[SECTION_INDEX["preferences"]] = 0, 1
+    return low, high
+
+
+# Inclusive range of every feature, as the app and the encoders accept it
+FEATURE_LOW, FEATURE_HIGH = _feature_ranges()
+
+
+def match_columns(columns):
+    """Maps each feature name to its column in ``columns``; raises ValueError if any is missing."""
+    by_key = {str(column).strip().casefold(): column for column in columns}
+    missing = [name for name in FEATURE_NAMES if name.casefold() not in by_key]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}.")
+    return [by_key[name.casefold()] for name in FEATURE_NAMES]
+
+
+def _frame_values(frame):
+    """Float matrix of the feature columns, NaN where a value is not a number or Yes/No."""
+    features = frame[match_columns(frame.columns)]
+    features.columns = FEATURE_NAMES
+    converted = {}
+    for name, dtype in features.dtypes.items():
+        if pd.api.types.is_numeric_dtype(dtype):
+            continue
+        series = features[name]
+        if name in SECTION_FEATURES["preferences"]:
+            series = series.astype(str).str.strip().str.lower().map(_PREFERENCE_VALUES)
+        converted[name] = pd.to_numeric(series, errors="coerce")
+    if converted:
+        features = features.assign(**converted)
+    # one conversion for the whole block; all-numeric files skip the loop above entirely
+    return features.to_numpy(dtype=np.float64)
+
+
+def _check_frame(frame):
+    values = _frame_values(frame)
+    with np.errstate(invalid="ignore"):
+        bad = np.isnan(values) | (values < FEATURE_LOW) | (values > FEATURE_HIGH) | (values != np.round(values))
+    errors = np.full(len(frame), "", dtype=object)
+    for row in np.flatnonzero(bad.any(axis=1)):
+        names = [FEATURE_NAMES[i] for i in np.flatnonzero(bad[row])]
+        errors[row] = f"Invalid {', '.join(names)}."
+    return values, errors
+
+
+def frame_errors(frame):
+    """Per-row error messages for a DataFrame of profiles ("" for valid rows)."""
+    return _check_frame(frame)[1]
+
+
+def encode_valid_rows(frame):
+    """Returns the int8 vectors of the valid rows and every row's error message."""
+    values, errors = _check_frame(frame)
+    return np.ascontiguousarray(values[errors == ""], dtype=np.int8), errors
+
+
+def encode_frame(frame):
+    """Encodes every row of a DataFrame into a contiguous (n_rows, 45) int8 array."""
+    X, errors = encode_valid_rows(frame)
+    invalid = np.flatnonzero(errors != "")
+    if invalid.size:
+        raise ValueError(f"{invalid.size} invalid rows; first at row {invalid[0]}: {errors[invalid[0]]}")
+    return X
+
+
+def check_model(model):
+    """Raises ValueError unless ``model`` takes FEATURE_NAMES and predicts CAREER_LABELS indices."""
+    n_features = getattr(model, "n_features_in_", None)
+    if n_features != NUM_FEATURES:
+        raise ValueError(f"The model expects {n_features} features, but the schema has {NUM_FEATURES}.")
+    classes = np.asarray(model.classes_)
+    if not np.array_equal(classes, np.arange(NUM_CAREERS)):
+        raise ValueError(
+            f"The model predicts classes {classes.tolist()}, but the schema has {NUM_CAREERS} careers (0-{NUM_CAREERS - 1})."
+        )
+    return model
+
+
+def load_career_model(path):
+    """``load_forest_engine`` that fails fast if the model does not match this schema."""
+    return check_model(load_forest_engine(path))
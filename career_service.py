@@ -0,0 +1,266 @@
+"""Standalone JSON prediction service for integrations such as the LMS.
+
+A small asyncio HTTP/1.1 server built only on the standard library. It
+loads the same model as the app through the same ModelHolder and
+CareerRanker. Profiles use the app's questionnaire names and go through
+career_schema.encode_profile, so the service and the UI build identical
+feature vectors and share the prediction caches.
+
+Endpoints:
+
+    GET  /health             {"status": "ok", "model": "<tag>"}
+    POST /v1/predict         {"profile": {...}, "k": 3}
+                             -> {"model": ..., "careers": [...]}
+    POST /v1/predict/batch   {"profiles": [{...}, ...], "k": 3}
+                             -> {"model": ..., "results": [{"careers": [...]} | {"error": "..."}]}
+
+A profile looks like ``{"age": 17, "subjects": {"Maths - Algebra": 4, ...},
+"skills": {...}, "interests": {...}, "preferences": {"Interested in
+research?": "Yes", ...}}``. Each returned career carries its probability and
+its CAREER_INFO details. A batch is scored with one ``predict_proba`` call;
+an invalid profile gets an error entry without failing the rest.
+
+Connections are kept alive (HTTP/1.1 default) until the client closes them
+or they idle for ``KEEP_ALIVE_TIMEOUT``. Beyond ``--max-connections`` open
+connections new ones get 503, and at most ``--max-concurrency`` predictions
+run at once in the scoring thread pool. The event loop itself never scores
+or loads the model: ``/health`` also asks the ModelHolder from the pool,
+since a changed artifact is hashed and loaded inside ``get()``. A request or
+header line longer than ``MAX_LINE_BYTES`` gets 400 or 431 and the
+connection is closed.
+
+Usage:
+    python career_service.py --port 8080
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import numpy as np
+
+from career_info import CAREER_INFO
+from career_ranking import DEFAULT_TOP_K, get_ranker, rank_proba
+from career_schema import CAREER_LABELS, encode_profile_dict, load_career_model
+from forest_engine import default_model_path
+from model_store import get_model_holder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_CONNECTIONS = 256
+DEFAULT_MAX_CONCURRENCY = 8
+KEEP_ALIVE_TIMEOUT = 15.0
+MAX_BODY_BYTES = 8 << 20
+# Longest request or header line (the StreamReader buffer limit)
+MAX_LINE_BYTES = 64 << 10
+MAX_BATCH_PROFILES = 1000
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def career_payload(class_index, probability):
+    """One ranked career with its details, as returned by the service."""
+    name = CAREER_LABELS[class_index]
+    return {"career": name, "probability": probability, **CAREER_INFO.get(name, {})}
+
+
+def _parse_k(body):
+    k = body.get("k", DEFAULT_TOP_K)
+    if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= len(CAREER_LABELS):
+        raise HTTPError(400, f"k must be an integer from 1 to {len(CAREER_LABELS)}.")
+    return k
+
+
+async def _read_line(reader, status, what):
+    """One CRLF-terminated line; a line over the reader's limit is answered with ``status``."""
+    try:
+        return await reader.readline()
+    except ValueError:  # readline's LimitOverrunError, after it discards the line
+        raise HTTPError(status, f"{what} longer than {MAX_LINE_BYTES} bytes.") from None
+
+
+class CareerService:
+    def __init__(self, model_path, max_connections=DEFAULT_MAX_CONNECTIONS,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, prediction_cache=None):
+        self.holder = get_model_holder(model_path, loader=load_career_model)
+        self.prediction_cache = prediction_cache
+        self.max_connections = max_connections
+        self.connections = 0
+        self._executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix="career-service")
+        self.holder.get()  # fail at startup, not on the first request, if the model is missing
+
+    # -- scoring (runs in the thread pool) --
+
+    def _ranker(self):
+        ranker = get_ranker(self.holder.get(), shared_path=self.prediction_cache)
+        return ranker.version, ranker  # the version it scores, which may lag the holder during a swap
+
+    def predict_one(self, profile, k):
+        x = encode_profile_dict(profile)
+        version, ranker = self._ranker()
+        return {"model": version.tag, "careers": [career_payload(c, p) for c, p in ranker.top_k(x, k)]}
+
+    def predict_batch(self, profiles, k):
+        results, rows, positions = [None] * len(profiles), [], []
+        for i, profile in enumerate(profiles):
+            try:
+                rows.append(encode_profile_dict(profile))
+                positions.append(i)
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+        version, ranker = self._ranker()
+        if rows:
+            proba = ranker.model.predict_proba(np.vstack(rows))
+            for i, row in zip(positions, proba):
+                results[i] = {"careers": [career_payload(c, p) for c, p in rank_proba(row, ranker.classes, k)]}
+        return {"model": version.tag, "results": results}
+
+    # -- HTTP --
+
+    async def dispatch(self, method, path, body):
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "Use GET.")
+            version = await asyncio.get_running_loop().run_in_executor(self._executor, self.holder.get)
+            return {"status": "ok", "model": version.tag}
+        if path not in ("/v1/predict", "/v1/predict/batch"):
+            raise HTTPError(404, f"No such endpoint: {path}")
+        if method != "POST":
+            raise HTTPError(405, "Use POST.")
+        try:
+            body = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "The request body is not valid JSON.") from None
+        if not isinstance(body, dict):
+            raise HTTPError(400, "The request body must be a JSON object.")
+        k = _parse_k(body)
+
+        loop = asyncio.get_running_loop()
+        if path == "/v1/predict":
+            if "profile" not in body:
+                raise HTTPError(400, "Missing profile.")
+            return await loop.run_in_executor(self._executor, self.predict_one, body["profile"], k)
+        profiles = body.get("profiles")
+        if not isinstance(profiles, list):
+            raise HTTPError(400, "profiles must be a list.")
+        if len(profiles) > MAX_BATCH_PROFILES:
+            raise HTTPError(413, f"At most {MAX_BATCH_PROFILES} profiles per batch.")
+        return await loop.run_in_executor(self._executor, self.predict_batch, profiles, k)
+
+    async def _read_request(self, reader):
+        """Returns (method, path, version, headers, body), or None at end of stream."""
+        request_line = await _read_line(reader, 400, "Request line")
+        if not request_line:
+            return None
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line.") from None
+        headers = {}
+        while True:
+            line = await _read_line(reader, 431, "Header line")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length.") from None
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Request bodies are limited to {MAX_BODY_BYTES} bytes.")
+        body = await reader.readexactly(length) if length else b""
+        return method, path.split("?", 1)[0], version, headers, body
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            await self._respond(writer, 503, {"error": "Too many connections; retry shortly."}, False)
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except HTTPError as e:
+                    await self._respond(writer, e.status, {"error": e.message}, False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                method, path, version, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                try:
+                    status, payload = 200, await self.dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": e.message}
+                except ValueError as e:
+                    status, payload = 400, {"error": str(e)}
+                except Exception:
+                    logger.exception("Request %s %s failed", method, path)
+                    status, payload = 500, {"error": "Internal error."}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+async def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = await asyncio.start_server(service.handle_connection, host, port, limit=MAX_LINE_BYTES)
+    logger.info("Serving career predictions on http://%s:%d", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve career predictions over HTTP/JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--model", default=None, help="bundle manifest or pickled forest (default: as the app)")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS)
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument(
+        "--prediction-cache", default=os.environ.get("CAREERPULSE_PREDICTION_CACHE", ".prediction_cache.sqlite3"),
+        help='shared SQLite prediction cache ("" to disable)',
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    service = CareerService(
+        args.model or default_model_path(), args.max_connections, args.max_concurrency, args.prediction_cache
+    )
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Out-of-core generation of the synthetic training set.
+
+``generate_dataset`` in modeltest.py builds the whole matrix in memory. For
+large datasets this module instead streams every career's samples into
+fixed-size shards, each a memory-mapped int8 ``.npy`` file, and generates the
+shards in a process pool. A ``manifest.json`` written last records the seed,
+the rule-table hash and the row count of every shard, so a dataset directory
+is self-describing and a half-written one is never mistaken for a complete
+one.
+
+Shards are read back with ``np.load(mmap_mode="r")``: evaluation streams them
+shard by shard, and training copies them into one contiguous int8 array
+without ever building Python lists.
+
+Usage:
+    python dataset_shards.py data/ --samples-per-career 1000000 --workers 8
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import modeltest
+
+DATASET_FORMAT = "careerpulse-dataset"
+DATASET_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+DEFAULT_SHARD_ROWS = 1 << 20
+# Rows generated per step inside a shard; bounds each worker's scratch memory.
+BLOCK_ROWS = 1 << 16
+
+
+def _write_shard(path, career_index, n_rows, seed_sequence):
+    """Generates one shard straight into a memory-mapped .npy file."""
+    rules = modeltest.compile_rules()
+    rng = np.random.default_rng(seed_sequence)
+    tmp_path = path + ".tmp.npy"
+    X = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.int8, shape=(n_rows, modeltest.NUM_FEATURES))
+    for start in range(0, n_rows, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, n_rows)
+        X[start:stop] = modeltest.generate_career_samples(career_index, stop - start, rng, rules)
+    X.flush()
+    del X
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_shards(out_dir, samples_per_career=modeltest.SAMPLES_PER_CAREER, seed=modeltest.SEED,
+                 shard_rows=DEFAULT_SHARD_ROWS, workers=None):
+    """Generates the dataset into ``out_dir`` and returns its manifest."""
+    os.makedirs(out_dir, exist_ok=True)
+    rules = modeltest.compile_rules()
+    career_seeds = np.random.SeedSequence(seed).spawn(modeltest.NUM_CAREERS)
+
+    shards, jobs = [], []
+    for career_index, career_seed in enumerate(career_seeds):
+        n_shards = -(-samples_per_career // shard_rows)
+        for k, shard_seed in enumerate(career_seed.spawn(n_shards)):
+            rows = min(shard_rows, samples_per_career - k * shard_rows)
+            name = f"X_{career_index:03d}_{k:05d}.npy"
+            shards.append({"file": name, "label": career_index, "rows": rows})
+            jobs.append((os.path.join(out_dir, name), career_index, rows, shard_seed))
+
+    # Regenerating overwrites shards in place: drop the old manifest first, so an
+    # interrupted run leaves no manifest rather than one describing mixed shards.
+    try:
+        os.remove(os.path.join(out_dir, MANIFEST_NAME))
+    except FileNotFoundError:
+        pass
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_write_shard, *job) for job in jobs]
+        for future in futures:
+            future.result()
+
+    manifest = {
+        "format": DATASET_FORMAT,
+        "format_version": DATASET_FORMAT_VERSION,
+        "seed": seed,
+        "samples_per_career": samples_per_career,
+        "shard_rows": shard_rows,
+        "rules_sha256": rules.digest,
+        "features": modeltest.FEATURE_NAMES,
+        "careers": modeltest.CAREER_LABELS,
+        "n_rows": sum(shard["rows"] for shard in shards),
+        "shards": shards,
+    }
+    tmp_path = os.path.join(out_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+    return manifest
+
+
+def read_manifest(data_dir):
+    with open(os.path.join(data_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != DATASET_FORMAT or manifest.get("format_version") != DATASET_FORMAT_VERSION:
+        raise ValueError(f"{data_dir} is not a version {DATASET_FORMAT_VERSION} {DATASET_FORMAT} directory.")
+    return manifest
+
+
+def iter_shards(data_dir):
+    """Yields (X, y) per shard; X is memory-mapped, y is a constant label array."""
+    for shard in read_manifest(data_dir)["shards"]:
+        X = np.load(os.path.join(data_dir, shard["file"]), mmap_mode="r")
+        if X.shape[0] != shard["rows"]:
+            raise ValueError(f"{shard['file']} has {X.shape[0]} rows, manifest says {shard['rows']}.")
+        yield X, np.full(X.shape[0], shard["label"], dtype=np.int64)
+
+
+def read_dataset(data_dir):
+    """Copies all shards into one contiguous int8 matrix and its labels."""
+    manifest = read_manifest(data_dir)
+    X = np.empty((manifest["n_rows"], len(manifest["features"])), dtype=np.int8)
+    y = np.empty(manifest["n_rows"], dtype=np.int64)
+    start = 0
+    for X_shard, y_shard in iter_shards(data_dir):
+        stop = start + X_shard.shape[0]
+        X[start:stop] = X_shard
+        y[start:stop] = y_shard
+        start = stop
+    return X, y
+
+
+def evaluate_shards(model, data_dir):
+    """Accuracy of ``model`` over a shard directory, one shard in memory at a time."""
+    correct = total = 0
+    for X, y in iter_shards(data_dir):
+        correct += int(np.count_nonzero(model.predict(X) == y))
+        total += len(y)
+    return correct / total if total else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic dataset as memory-mapped shards.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--samples-per-career", type=int, default=modeltest.SAMPLES_PER_CAREER)
+    parser.add_argument("--seed", type=int, default=modeltest.SEED)
+    parser.add_argument("--shard-rows", type=int, default=DEFAULT_SHARD_ROWS)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = write_shards(args.out_dir, args.samples_per_career, args.seed, args.shard_rows, args.workers)
+    print(
+        f"Wrote {manifest['n_rows']:,} rows in {len(manifest['shards'])} shards "
+        f"to {args.out_dir} in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Flat-array export of the trained forest, opened with memory mapping.
+
+A pickled RandomForestClassifier is a graph of Python objects, so every
+Streamlit worker process ends up with a private ~100 MB copy. The bundle
+written here stores the same forest as a handful of flat ``.npy`` arrays that
+``load_forest_bundle`` maps read-only: all processes on a host share one
+page-cache copy, and a cold start is an mmap instead of an unpickle.
+
+Layout (all node arrays are indexed by a global node id):
+
+    feature         int16    split feature, -1 for leaves
+    threshold       float64  go left when x[feature] <= threshold; +inf for leaves
+    children_left   int32    global id of the left child; leaves point to themselves
+    children_right  int32    global id of the right child; leaves point to themselves
+    leaf_index      int32    row of ``leaf_values`` for leaves, -1 for split nodes
+    leaf_values     float64  (n_unique_leaves, n_classes) per-tree class probabilities
+    roots           int32    global id of each tree's root, in estimator order
+    classes         -        the model's ``classes_``
+
+Leaves point to themselves with an infinite threshold so a fixed number of
+traversal steps can be applied to every tree without checking for leaves.
+Trees may share nodes: forest_prune.py stores identical subtrees once.
+Leaf distributions are deduplicated: fully grown trees have pure leaves, so
+most of them share one of ``n_classes`` rows.
+
+The bundle directory holds one subdirectory per exported version and a
+``manifest.json`` naming the current one. The manifest is replaced
+atomically, so a reader never sees a half-written bundle. The version the
+manifest named before is kept too. A reader that read the old manifest just
+before the swap, such as a prediction worker or another app process
+starting up, can still open its arrays. Versions older than that are
+removed on the next export.
+
+modeltest.py exports the bundle whenever it publishes a model. A deployed
+pickle, such as the shipped career_model.pkl, is exported on its own with
+the command below. The manifest then records the pickle's SHA-256
+(``source_sha256``), and the app, the prediction service and batch_score.py
+open the bundle instead of unpickling.
+
+Usage:
+    python forest_bundle.py career_model.pkl --out career_model_forest
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+
+BUNDLE_FORMAT = "careerpulse-forest"
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+NODE_ARRAYS = ("feature", "threshold", "children_left", "children_right", "leaf_index")
+BUNDLE_ARRAYS = NODE_ARRAYS + ("leaf_values", "roots", "classes")
+
+
+def flatten_forest(model):
+    """Returns the bundle arrays for a fitted RandomForestClassifier."""
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Only single-output forests can be flattened.")
+
+    n_classes = int(model.n_classes_)
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    max_depth = 0
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        node_ids = np.arange(tree.node_count, dtype=np.int32) + offset
+        is_leaf = tree.children_left < 0
+
+        features.append(np.where(is_leaf, -1, tree.feature).astype(np.int16))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset).astype(np.int32))
+        rights.append(np.where(is_leaf, node_ids, tree.children_right + offset).astype(np.int32))
+        # Same rows DecisionTreeClassifier.predict_proba returns for a leaf.
+        values.append(np.where(is_leaf[:, None], tree.value[:, 0, :n_classes], np.nan))
+
+        roots.append(offset)
+        max_depth = max(max_depth, tree.max_depth)
+        offset += tree.node_count
+
+    feature = np.concatenate(features)
+    values = np.concatenate(values)
+    leaf_mask = feature < 0
+    leaf_values, inverse = np.unique(values[leaf_mask], axis=0, return_inverse=True)
+    leaf_index = np.full(offset, -1, dtype=np.int32)
+    leaf_index[leaf_mask] = inverse.reshape(-1)
+
+    arrays = {
+        "feature": feature,
+        "threshold": np.concatenate(thresholds).astype(np.float64),
+        "children_left": np.concatenate(lefts),
+        "children_right": np.concatenate(rights),
+        "leaf_index": leaf_index,
+        "leaf_values": np.ascontiguousarray(leaf_values, dtype=np.float64),
+        "roots": np.asarray(roots, dtype=np.int32),
+        "classes": np.asarray(model.classes_),
+    }
+    meta = {
+        "n_features_in": int(model.n_features_in_),
+        "n_classes": n_classes,
+        "n_estimators": len(model.estimators_),
+        "n_nodes": int(offset),
+        "max_depth": int(max_depth),
+    }
+    return arrays, meta
+
+
+def _array_sha256(array):
+    return hashlib.sha256(np.ascontiguousarray(array).view(np.uint8)).hexdigest()
+
+
+def write_bundle(arrays, meta, bundle_dir, source_sha256=None):
+    """Writes ``arrays`` as a new bundle version and points the manifest at it."""
+    digests = {name: _array_sha256(arrays[name]) for name in BUNDLE_ARRAYS}
+    version = hashlib.sha256(json.dumps(digests, sort_keys=True).encode()).hexdigest()[:16]
+    version_dir = f"v{version}"
+    manifest_path = os.path.join(bundle_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path) as f:
+            previous_dir = json.load(f).get("directory")
+    except (OSError, ValueError):
+        previous_dir = None
+
+    os.makedirs(os.path.join(bundle_dir, version_dir), exist_ok=True)
+    for name in BUNDLE_ARRAYS:
+        np.save(os.path.join(bundle_dir, version_dir, f"{name}.npy"), np.ascontiguousarray(arrays[name]))
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "version": version,
+        "directory": version_dir,
+        "source_sha256": source_sha256,
+        **meta,
+        "arrays": {name: {"file": f"{name}.npy", "sha256": digests[name]} for name in BUNDLE_ARRAYS},
+    }
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    # Keep the previous version for readers of the old manifest; older ones
+    # can go, and processes that still map them keep their pages.
+    keep = {version_dir, previous_dir}
+    for entry in os.listdir(bundle_dir):
+        path = os.path.join(bundle_dir, entry)
+        if entry.startswith("v") and entry not in keep and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+    return manifest_path
+
+
+def export_forest(model, bundle_dir, source_sha256=None):
+    """Flattens a fitted forest and writes it to ``bundle_dir``."""
+    arrays, meta = flatten_forest(model)
+    return write_bundle(arrays, meta, bundle_dir, source_sha256=source_sha256)
+
+
+class FlatForest:
+    """A forest read from a bundle, with the classifier's predict API."""
+
+    def __init__(self, arrays, meta, manifest=None):
+        self.manifest = manifest or {}
+        for name in BUNDLE_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.classes_ = self.classes
+        self.n_features_in_ = meta["n_features_in"]
+        self.n_classes_ = meta["n_classes"]
+        self.n_estimators = meta["n_estimators"]
+        self.max_depth = meta["max_depth"]
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in BUNDLE_ARRAYS)
+
+    def _check_X(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, but the forest expects {self.n_features_in_} features per row."
+            )
+        return X
+
+    def apply(self, X):
+        """Returns the leaf node id reached in every tree, shape (n_rows, n_trees)."""
+        X = self._check_X(X)
+        rows = np.arange(X.shape[0])
+        leaves = np.empty((X.shape[0], len(self.roots)), dtype=np.int32)
+        for t, root in enumerate(self.roots):
+            node = np.full(X.shape[0], root, dtype=np.int32)
+            while True:
+                goes_left = X[rows, self.feature[node]] <= self.threshold[node]
+                nxt = np.where(goes_left, self.children_left[node], self.children_right[node])
+                if np.array_equal(nxt, node):
+                    break
+                node = nxt
+            leaves[:, t] = node
+        return leaves
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        proba = np.zeros((leaves.shape[0], self.n_classes_), dtype=np.float64)
+        # Accumulate in estimator order, as RandomForestClassifier does, so the
+        # floating point sums are identical.
+        for t in range(leaves.shape[1]):
+            proba += self.leaf_values[self.leaf_index[leaves[:, t]]]
+        proba /= leaves.shape[1]
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+def read_manifest(bundle_dir):
+    with open(os.path.join(bundle_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"{bundle_dir} is not a {BUNDLE_FORMAT} bundle.")
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported bundle format version {manifest.get('format_version')} "
+            f"(expected {BUNDLE_FORMAT_VERSION}); re-export the model."
+        )
+    return manifest
+
+
+def load_forest_bundle(path, mmap=True):
+    """Opens a bundle directory (or its manifest.json) as a FlatForest.
+
+    With ``mmap`` the arrays are mapped read-only and shared through the page
+    cache with every other process that maps the same version.
+    """
+    bundle_dir = os.path.dirname(path) if os.path.basename(path) == MANIFEST_NAME else path
+    manifest = read_manifest(bundle_dir)
+    version_dir = os.path.join(bundle_dir, manifest["directory"])
+    arrays = {
+        name: np.load(os.path.join(version_dir, entry["file"]), mmap_mode="r" if mmap else None)
+        for name, entry in manifest["arrays"].items()
+    }
+    return FlatForest(arrays, manifest, manifest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a pickled forest as a memory-mapped flat-array bundle.")
+    parser.add_argument("model", nargs="?", default="career_model.pkl", help="pickled RandomForestClassifier")
+    parser.add_argument("--out", default="career_model_forest", help="bundle directory (default: where the app looks)")
+    parser.add_argument("--force", action="store_true", help="export even if the bundle is already current")
+    args = parser.parse_args()
+
+    from career_schema import check_model  # imports this module
+    from model_store import file_sha256
+
+    sha256 = file_sha256(args.model)
+    try:
+        current = read_manifest(args.out).get("source_sha256") == sha256
+    except (OSError, ValueError):
+        current = False
+    if current and not args.force:
+        print(f"{args.out} is already the export of {args.model} ({sha256[:12]}).")
+        return
+    with open(args.model, "rb") as f:
+        model = pickle.load(f)
+    try:
+        check_model(model)  # never export a model the app would mislabel
+    except ValueError as e:
+        raise SystemExit(f"{args.model}: {e}")
+    manifest_path = export_forest(model, args.out, source_sha256=sha256)
+    print(f"Exported {args.model} ({sha256[:12]}) to {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
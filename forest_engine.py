@@ -0,0 +1,280 @@
+"""Low-latency inference over the flat forest arrays.
+
+``RandomForestClassifier.predict`` on one 45-feature row pays for input
+validation, joblib dispatch and a Python call per estimator, which costs far
+more than walking 100 shallow trees. ForestEngine instead advances every tree
+one level per step with a few NumPy gathers over the arrays written by
+forest_bundle. Leaves point to themselves, so ``max_depth`` steps land every
+tree on its leaf without branching. If numba is installed the same walk runs
+as a compiled loop instead.
+
+Probabilities are accumulated in estimator order and then divided by the
+number of trees, exactly as sklearn does, so predictions and probabilities
+match the original forest bit for bit. ``python forest_engine.py`` checks that
+parity on random profiles and prints a p50/p99 latency comparison.
+
+Two cheaper modes serve interactive use. ``predict_early_exit`` lets the
+trees vote in estimator order and stops a row as soon as the leading career
+is ahead of the runner-up by more than the number of trees still to vote.
+Each tree adds at most 1 to any class, so the answer is always the same
+argmax as ``predict``; ``check_parity`` verifies that too. The questionnaire's
+live "current best match" uses it through ``CareerRanker.best_match``, and
+Analyze still runs the full forest for the ranked probabilities.
+``predict(X, n_trees=k)`` is an approximate preview that uses only the first
+``k`` trees. Each tree was fit on its own bootstrap sample, so the first
+``k`` form a smaller random forest.
+"""
+import argparse
+import os
+import pickle
+import time
+
+import numpy as np
+
+from forest_bundle import MANIFEST_NAME, FlatForest, flatten_forest, load_forest_bundle
+
+try:
+    import numba
+except ImportError:  # optional: the NumPy path is used instead
+    numba = None
+
+DEFAULT_BUNDLE_DIR = "career_model_forest"
+DEFAULT_PICKLE_PATH = "career_model.pkl"
+
+# Extra vote margin required to stop early, far above floating point error.
+EARLY_EXIT_SLACK = 1e-9
+# Trees walked between margin checks on the NumPy path.
+EARLY_EXIT_BLOCK = 10
+
+
+def _walk_kernel(X, feature, threshold, children_left, children_right, leaf_index, leaf_values, roots, out):
+    for i in range(X.shape[0]):
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while feature[node] >= 0:
+                if X[i, feature[node]] <= threshold[node]:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+            row = leaf_index[node]
+            for c in range(out.shape[1]):
+                out[i, c] += leaf_values[row, c]
+
+
+def _early_exit_kernel(X, feature, threshold, children_left, children_right, leaf_index, leaf_values, roots,
+                       votes, trees_used):
+    n_trees = roots.shape[0]
+    for i in range(X.shape[0]):
+        for t in range(n_trees):
+            node = roots[t]
+            while feature[node] >= 0:
+                if X[i, feature[node]] <= threshold[node]:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+            row = leaf_index[node]
+            first = second = 0.0
+            for c in range(votes.shape[1]):
+                votes[i, c] += leaf_values[row, c]
+                if votes[i, c] > first:
+                    first, second = votes[i, c], first
+                elif votes[i, c] > second:
+                    second = votes[i, c]
+            trees_used[i] = t + 1
+            if first - second > n_trees - t - 1 + EARLY_EXIT_SLACK:
+                break
+
+
+_jit_walk_kernel = numba.njit(cache=True, nogil=True)(_walk_kernel) if numba is not None else None
+_jit_early_exit_kernel = numba.njit(cache=True, nogil=True)(_early_exit_kernel) if numba is not None else None
+
+
+class ForestEngine:
+    """predict/predict_proba over a FlatForest, tuned for one row at a time."""
+
+    def __init__(self, forest, use_jit=None):
+        self.forest = forest
+        # np.asarray drops the memmap subclass without copying, so the pages
+        # stay shared with the other processes mapping the bundle.
+        self.feature = np.asarray(forest.feature)
+        self.threshold = np.asarray(forest.threshold)
+        self.children_left = np.asarray(forest.children_left)
+        self.children_right = np.asarray(forest.children_right)
+        self.leaf_index = np.asarray(forest.leaf_index)
+        self.leaf_values = np.asarray(forest.leaf_values)
+        self.roots = np.asarray(forest.roots, dtype=np.int32)
+        self.classes_ = forest.classes_
+        self.n_features_in_ = forest.n_features_in_
+        self.n_classes_ = forest.n_classes_
+        self.n_estimators = forest.n_estimators
+        self.max_depth = forest.max_depth
+        self.use_jit = _jit_walk_kernel is not None if use_jit is None else use_jit
+        if self.use_jit and _jit_walk_kernel is None:
+            raise ImportError("use_jit=True requires numba.")
+
+    @classmethod
+    def from_estimator(cls, model, **kwargs):
+        """Builds an engine from a fitted RandomForestClassifier."""
+        arrays, meta = flatten_forest(model)
+        return cls(FlatForest(arrays, meta), **kwargs)
+
+    @property
+    def nbytes(self):
+        return self.forest.nbytes
+
+    def _check_X(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has shape {X.shape}, but the forest expects {self.n_features_in_} features per row."
+            )
+        return X
+
+    def _walk(self, X, roots):
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(roots, (X.shape[0], len(roots)))
+        for _ in range(self.max_depth):
+            goes_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(goes_left, self.children_left[nodes], self.children_right[nodes])
+        return nodes
+
+    def apply(self, X):
+        """Returns the leaf node id reached in every tree, shape (n_rows, n_trees)."""
+        return self._walk(self._check_X(X), self.roots)
+
+    def predict_proba(self, X, n_trees=None):
+        """Class probabilities from all trees, or a preview from the first ``n_trees``."""
+        X = self._check_X(X)
+        roots = self.roots if n_trees is None else self.roots[: max(1, n_trees)]
+        if self.use_jit:
+            proba = np.zeros((X.shape[0], self.n_classes_), dtype=np.float64)
+            _jit_walk_kernel(
+                X, self.feature, self.threshold, self.children_left, self.children_right,
+                self.leaf_index, self.leaf_values, roots, proba,
+            )
+        else:
+            votes = self.leaf_values[self.leaf_index[self._walk(X, roots)]]
+            # cumsum adds the trees strictly in order, like sklearn's accumulation.
+            proba = np.cumsum(votes, axis=1)[:, -1]
+        proba /= len(roots)
+        return proba
+
+    def predict(self, X, n_trees=None):
+        return self.classes_.take(np.argmax(self.predict_proba(X, n_trees), axis=1), axis=0)
+
+    def predict_early_exit(self, X):
+        """Same labels as ``predict``, stopping each row once its vote is decided.
+
+        Returns ``(labels, trees_used)``; ``trees_used`` counts the trees each
+        row actually walked.
+        """
+        X = self._check_X(X)
+        votes = np.zeros((X.shape[0], self.n_classes_), dtype=np.float64)
+        trees_used = np.full(X.shape[0], self.n_estimators, dtype=np.int32)
+        if self.use_jit:
+            _jit_early_exit_kernel(
+                X, self.feature, self.threshold, self.children_left, self.children_right,
+                self.leaf_index, self.leaf_values, self.roots, votes, trees_used,
+            )
+        else:
+            active = np.arange(X.shape[0])
+            for start in range(0, self.n_estimators, EARLY_EXIT_BLOCK):
+                stop = min(start + EARLY_EXIT_BLOCK, self.n_estimators)
+                block = self.leaf_values[self.leaf_index[self._walk(X[active], self.roots[start:stop])]]
+                for t in range(block.shape[1]):
+                    votes[active] += block[:, t]
+                top_two = np.partition(votes[active], -2, axis=1)[:, -2:]
+                decided = top_two[:, 1] - top_two[:, 0] > self.n_estimators - stop + EARLY_EXIT_SLACK
+                trees_used[active[decided]] = stop
+                active = active[~decided]
+                if not active.size:
+                    break
+        # Rows that ran to the end hold sklearn's exact sums; decided rows have
+        # a lead no rounding can close.
+        labels = self.classes_.take(np.argmax(votes / self.n_estimators, axis=1), axis=0)
+        return labels, trees_used
+
+
+def default_model_path(bundle_dir=DEFAULT_BUNDLE_DIR, pickle_path=DEFAULT_PICKLE_PATH):
+    """The exported bundle's manifest if there is one, else the pickled forest."""
+    manifest_path = os.path.join(bundle_dir, MANIFEST_NAME)
+    return manifest_path if os.path.exists(manifest_path) else pickle_path
+
+
+def load_forest_engine(path, use_jit=None):
+    """Opens a bundle (directory or manifest) or a pickled forest as a ForestEngine."""
+    if os.path.isdir(path) or os.path.basename(path) == MANIFEST_NAME:
+        return ForestEngine(load_forest_bundle(path), use_jit=use_jit)
+    with open(path, "rb") as f:
+        return ForestEngine.from_estimator(pickle.load(f), use_jit=use_jit)
+
+
+def random_profiles(n_rows, seed=0):
+    """Random integer profiles covering the app's input ranges."""
+    rng = np.random.default_rng(seed)
+    ages = rng.integers(10, 56, size=(n_rows, 1))
+    scores = rng.integers(0, 6, size=(n_rows, 39))
+    preferences = rng.integers(0, 2, size=(n_rows, 5))
+    return np.hstack([ages, scores, preferences])
+
+
+def check_parity(model, engine, X):
+    """Returns the number of rows where the engine disagrees with ``model``.
+
+    A row disagrees if its predicted class (full or early-exit vote) or any
+    probability is not bit-identical.
+    """
+    expected_proba = model.predict_proba(X)
+    actual_proba = engine.predict_proba(X)
+    proba_mismatch = np.any(expected_proba != actual_proba, axis=1)
+    expected_labels = model.predict(X)
+    label_mismatch = (expected_labels != engine.predict(X)) | (expected_labels != engine.predict_early_exit(X)[0])
+    return int(np.count_nonzero(proba_mismatch | label_mismatch))
+
+
+def latency_percentiles(predict, rows, repeats=1):
+    """Calls ``predict`` on each row separately; returns (p50, p99) in microseconds."""
+    samples = []
+    for _ in range(repeats):
+        for row in rows:
+            x = row.reshape(1, -1)
+            start = time.perf_counter_ns()
+            predict(x)
+            samples.append(time.perf_counter_ns() - start)
+    p50, p99 = np.percentile(samples, [50, 99]) / 1e3
+    return p50, p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check ForestEngine parity and benchmark per-row latency.")
+    parser.add_argument("--model", default="career_model.pkl", help="pickled RandomForestClassifier")
+    parser.add_argument("--rows", type=int, default=20000, help="random profiles for the parity check")
+    parser.add_argument("--bench-rows", type=int, default=500, help="rows timed one at a time")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.model, "rb") as f:
+        model = pickle.load(f)
+    engines = {"numpy": ForestEngine.from_estimator(model, use_jit=False)}
+    if _jit_walk_kernel is not None:
+        engines["numba"] = ForestEngine.from_estimator(model, use_jit=True)
+
+    X = random_profiles(args.rows, seed=args.seed)
+    failed = False
+    for name, engine in engines.items():
+        mismatches = check_parity(model, engine, X)
+        failed |= mismatches > 0
+        print(f"parity [{name}]: {mismatches} of {len(X)} rows differ from sklearn")
+
+    bench_rows = random_profiles(args.bench_rows, seed=args.seed + 1)
+    for name, predict in [("sklearn", model.predict)] + [(n, e.predict) for n, e in engines.items()]:
+        predict(bench_rows[:1])  # warm-up (JIT compilation, lazy imports)
+        p50, p99 = latency_percentiles(predict, bench_rows)
+        print(f"latency [{name}]: p50 {p50:8.1f} us   p99 {p99:8.1f} us")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
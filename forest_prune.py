@@ -0,0 +1,158 @@
+"""Structural pruning and cross-tree subtree sharing for the flat forest.
+
+Trees grown on the synthetic data contain splits that can never change the
+answer on the app's integer inputs. This optimizer rebuilds a FlatForest
+bottom-up and removes them:
+
+* Splits already decided by the path above them (``x <= 3.5`` under
+  ``x <= 2.5``), or by the input domain (``preference <= 1.5``), are
+  replaced by the child that is always taken.
+* Thresholds are snapped to ``floor(t) + 0.5``, which is equivalent for
+  integer inputs and lets identical splits from different trees match.
+* Every node is interned in one shared pool keyed by its content, so
+  identical subtrees, within a tree or across trees, are stored once.
+* A split whose two children are the same pooled node, such as two sibling
+  leaves with the same class distribution, collapses into that child.
+
+The result is a DAG in the same bundle layout, since node ids are global and
+trees only share nodes. Every rule above is exact for integer inputs inside
+the domain, and ``verify_equivalence`` checks this on random and extreme
+profiles before a pruned bundle is written.
+
+Usage:
+    python forest_prune.py career_model_forest --out career_model_forest
+"""
+import argparse
+import math
+import sys
+
+import numpy as np
+
+from career_schema import FEATURE_HIGH, FEATURE_LOW
+from forest_bundle import FlatForest, load_forest_bundle, write_bundle
+from forest_engine import ForestEngine
+
+# Inclusive range of every feature as the app collects it
+DOMAIN_LOW = FEATURE_LOW
+DOMAIN_HIGH = FEATURE_HIGH
+
+
+def prune_forest(forest, domain_low=DOMAIN_LOW, domain_high=DOMAIN_HIGH):
+    """Returns the bundle arrays of a pruned, subtree-shared copy of ``forest``."""
+    feature = forest.feature.tolist()
+    threshold = forest.threshold.tolist()
+    left = forest.children_left.tolist()
+    right = forest.children_right.tolist()
+    leaf_index = forest.leaf_index.tolist()
+
+    pool = {}
+    new_feature, new_threshold, new_left, new_right, new_leaf_index = [], [], [], [], []
+    depth = []
+
+    def intern(key, f, t, l, r, leaf):
+        node = pool.get(key)
+        if node is None:
+            node = pool[key] = len(new_feature)
+            new_feature.append(f)
+            new_threshold.append(t)
+            new_left.append(node if l is None else l)
+            new_right.append(node if r is None else r)
+            new_leaf_index.append(leaf)
+            depth.append(0 if l is None else 1 + max(depth[l], depth[r]))
+        return node
+
+    lo = [int(v) for v in domain_low]
+    hi = [int(v) for v in domain_high]
+
+    def build(node):
+        f = feature[node]
+        if f < 0:
+            return intern(("leaf", leaf_index[node]), -1, math.inf, None, None, leaf_index[node])
+        cut = math.floor(threshold[node])  # x <= t  <=>  x <= cut for integers
+        if hi[f] <= cut:
+            return build(left[node])
+        if lo[f] > cut:
+            return build(right[node])
+
+        saved = hi[f]
+        hi[f] = cut
+        l = build(left[node])
+        hi[f] = saved
+
+        saved = lo[f]
+        lo[f] = cut + 1
+        r = build(right[node])
+        lo[f] = saved
+
+        if l == r:
+            return l
+        return intern(("split", f, cut, l, r), f, cut + 0.5, l, r, -1)
+
+    roots = [build(root) for root in forest.roots.tolist()]
+
+    arrays = {
+        "feature": np.asarray(new_feature, dtype=np.int16),
+        "threshold": np.asarray(new_threshold, dtype=np.float64),
+        "children_left": np.asarray(new_left, dtype=np.int32),
+        "children_right": np.asarray(new_right, dtype=np.int32),
+        "leaf_index": np.asarray(new_leaf_index, dtype=np.int32),
+        "leaf_values": np.asarray(forest.leaf_values),
+        "roots": np.asarray(roots, dtype=np.int32),
+        "classes": np.asarray(forest.classes_),
+    }
+    meta = {
+        "n_features_in": int(forest.n_features_in_),
+        "n_classes": int(forest.n_classes_),
+        "n_estimators": int(forest.n_estimators),
+        "n_nodes": len(new_feature),
+        "max_depth": max(depth[root] for root in roots),
+    }
+    return arrays, meta
+
+
+def domain_samples(n_samples, seed=0, domain_low=DOMAIN_LOW, domain_high=DOMAIN_HIGH):
+    """Random profiles from the domain, plus all-minimum and all-maximum rows."""
+    rng = np.random.default_rng(seed)
+    X = rng.integers(domain_low, domain_high + 1, size=(n_samples, len(domain_low)))
+    return np.vstack([domain_low, domain_high, X])
+
+
+def verify_equivalence(original, pruned, n_samples=200000, seed=0, batch_rows=10000):
+    """Returns the number of sampled profiles whose probabilities differ."""
+    X = domain_samples(n_samples, seed)
+    a, b = ForestEngine(original, use_jit=False), ForestEngine(pruned, use_jit=False)
+    mismatches = 0
+    for start in range(0, len(X), batch_rows):
+        rows = X[start : start + batch_rows]
+        mismatches += int(np.count_nonzero(np.any(a.predict_proba(rows) != b.predict_proba(rows), axis=1)))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prune and deduplicate a forest bundle.")
+    parser.add_argument("bundle_dir")
+    parser.add_argument("--out", help="bundle directory to write (default: report only)")
+    parser.add_argument("--samples", type=int, default=200000, help="random profiles for the equivalence check")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    original = load_forest_bundle(args.bundle_dir)
+    arrays, meta = prune_forest(original)
+    pruned = FlatForest(arrays, meta)
+    n_before, n_after = len(original.feature), len(pruned.feature)
+    print(
+        f"nodes: {n_before:,} -> {n_after:,} ({1 - n_after / n_before:.1%} fewer), "
+        f"bytes: {original.nbytes:,} -> {pruned.nbytes:,}, max depth {original.max_depth} -> {pruned.max_depth}"
+    )
+
+    mismatches = verify_equivalence(original, pruned, args.samples, args.seed)
+    print(f"equivalence: {mismatches} of {args.samples + 2} sampled profiles differ")
+    if mismatches:
+        sys.exit(1)
+    if args.out:
+        write_bundle(arrays, meta, args.out, source_sha256=original.manifest.get("source_sha256"))
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
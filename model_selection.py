@@ -0,0 +1,220 @@
+"""Size- and latency-budgeted model selection for the career forest.
+
+The stock forest (100 unbounded trees) pickles to tens of megabytes although
+the synthetic data needs far less capacity. This harness trains a grid of
+``n_estimators``/``max_depth``/``min_samples_leaf``/``max_leaf_nodes``
+candidates in a process pool and measures, for each one:
+
+    accuracy    on a held-out set drawn with a different seed
+    size        pickled artifact bytes (and flat bundle bytes)
+    load        seconds to unpickle the artifact
+    latency     p50/p99 single-row ForestEngine latency
+
+Candidates are stored in the BuildCache under the same keys modeltest.py
+uses, so a rerun refits only new ones. Load time and latency are measured
+one candidate at a time after every fit has finished, so no timing competes
+with the pool for cores.
+
+It prints the Pareto frontier over (accuracy, size, latency) and publishes
+the most accurate candidate that fits ``--max-size-mb`` and
+``--max-latency-us`` to the model path and its bundle, ready for main.py,
+through the same checks and publish step as modeltest.py.
+
+Usage:
+    python model_selection.py --max-size-mb 5 --max-latency-us 500
+"""
+import argparse
+import itertools
+import json
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+import modeltest
+from build_cache import DEFAULT_CACHE_DIR, BuildCache
+from career_schema import check_model
+from forest_bundle import flatten_forest
+from forest_engine import ForestEngine, latency_percentiles
+
+DEFAULT_GRID = {
+    "n_estimators": [25, 50, 100],
+    "max_depth": [None, 12, 20],
+    "min_samples_leaf": [1, 2, 5],
+    "max_leaf_nodes": [None, 64, 256],
+}
+
+# Per-worker cache and datasets, set up once by the pool initializer
+_cache = None
+_data_key = None
+_train = None
+_test = None
+
+
+def _init_worker(cache_dir, data_key, samples_per_career, seed):
+    global _cache, _data_key, _train, _test
+    _cache = BuildCache(cache_dir)
+    _data_key = data_key
+    _train = _cache.load_dataset(data_key)
+    _test = modeltest.generate_dataset(max(samples_per_career // 4, 1), seed + 1)
+
+
+def fit_candidate(params):
+    """Trains one candidate into the build cache (unless it is there) and returns its accuracy."""
+    X_test, y_test = _test
+    model = RandomForestClassifier(**{**modeltest.MODEL_PARAMS, **params})
+    key = modeltest.model_key(_data_key, model)
+
+    fit_seconds = None
+    if _cache.has_model(key):
+        model = _cache.load_model(key)
+    else:
+        start = time.perf_counter()
+        model.fit(*_train)
+        fit_seconds = time.perf_counter() - start
+        model.set_params(n_jobs=None, verbose=0, warm_start=False)
+        _cache.store_model(key, model)
+
+    return {
+        "params": params,
+        "key": key,
+        "accuracy": float(np.mean(model.predict(X_test) == y_test)),
+        "fit_seconds": fit_seconds,
+    }
+
+
+def measure_candidate(result, cache, X_test, latency_rows=200):
+    """Adds a fitted candidate's size, load time and latency to ``result``."""
+    with open(cache.model_path(result["key"]), "rb") as f:
+        blob = f.read()
+    start = time.perf_counter()
+    model = pickle.loads(blob)
+    load_seconds = time.perf_counter() - start
+
+    arrays, _ = flatten_forest(model)
+    engine = ForestEngine.from_estimator(model)
+    engine.predict(X_test[:1])  # warm-up
+    p50, p99 = latency_percentiles(engine.predict, X_test[:latency_rows])
+
+    result.update(
+        size_bytes=len(blob),
+        bundle_bytes=int(sum(a.nbytes for a in arrays.values())),
+        load_seconds=load_seconds,
+        latency_p50_us=p50,
+        latency_p99_us=p99,
+    )
+    return result
+
+
+def pareto_frontier(results):
+    """Candidates no other candidate beats on accuracy, size and latency at once."""
+    def dominates(a, b):
+        no_worse = (
+            a["accuracy"] >= b["accuracy"]
+            and a["size_bytes"] <= b["size_bytes"]
+            and a["latency_p50_us"] <= b["latency_p50_us"]
+        )
+        better = (
+            a["accuracy"] > b["accuracy"]
+            or a["size_bytes"] < b["size_bytes"]
+            or a["latency_p50_us"] < b["latency_p50_us"]
+        )
+        return no_worse and better
+
+    frontier = [r for r in results if not any(dominates(other, r) for other in results)]
+    return sorted(frontier, key=lambda r: r["size_bytes"])
+
+
+def select_within_budget(results, max_size_bytes=None, max_latency_us=None):
+    """The most accurate candidate within budget (smallest on ties), or None."""
+    fits = [
+        r for r in results
+        if (max_size_bytes is None or r["size_bytes"] <= max_size_bytes)
+        and (max_latency_us is None or r["latency_p50_us"] <= max_latency_us)
+    ]
+    if not fits:
+        return None
+    return max(fits, key=lambda r: (r["accuracy"], -r["size_bytes"]))
+
+
+def grid_candidates(grid):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def _parse_values(text):
+    return [None if v.strip().lower() == "none" else int(v) for v in text.split(",")]
+
+
+def _describe(result):
+    params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+    return (
+        f"acc {result['accuracy']:.4f}  size {result['size_bytes'] / 1e6:7.2f} MB  "
+        f"bundle {result['bundle_bytes'] / 1e6:6.2f} MB  load {result['load_seconds'] * 1e3:7.1f} ms  "
+        f"p50 {result['latency_p50_us']:7.1f} us  | {params}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search forest hyperparameters under size and latency budgets.")
+    for name, values in DEFAULT_GRID.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=_parse_values,
+            default=values, help=f"comma-separated values (default: {values})",
+        )
+    parser.add_argument("--samples-per-career", type=int, default=modeltest.SAMPLES_PER_CAREER)
+    parser.add_argument("--seed", type=int, default=modeltest.SEED)
+    parser.add_argument("--max-size-mb", type=float, default=None)
+    parser.add_argument("--max-latency-us", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--report", default="model_selection.json", help="where to write all results")
+    parser.add_argument("--out", default="career_model.pkl")
+    parser.add_argument("--bundle-dir", default="career_model_forest")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="report only; don't write the selected model")
+    args = parser.parse_args()
+
+    grid = {name: getattr(args, name) for name in DEFAULT_GRID}
+    candidates = grid_candidates(grid)
+    cache = BuildCache(args.cache_dir)
+    data_key = modeltest.dataset_key(args.samples_per_career, args.seed)
+    if cache.load_dataset(data_key) is None:
+        cache.store_dataset(data_key, *modeltest.generate_dataset(args.samples_per_career, args.seed))
+
+    print(f"Fitting {len(candidates)} candidates...")
+    with ProcessPoolExecutor(
+        max_workers=args.workers, initializer=_init_worker,
+        initargs=(args.cache_dir, data_key, args.samples_per_career, args.seed),
+    ) as pool:
+        results = list(pool.map(fit_candidate, candidates))
+
+    # Serially, once the pool is gone, so the timings are not contended
+    print("Measuring load time and latency...")
+    X_test, _ = modeltest.generate_dataset(max(args.samples_per_career // 4, 1), args.seed + 1)
+    for result in results:
+        measure_candidate(result, cache, X_test)
+
+    with open(args.report, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("Pareto frontier (accuracy / size / latency):")
+    for result in pareto_frontier(results):
+        print("  " + _describe(result))
+
+    max_size = args.max_size_mb * 1e6 if args.max_size_mb is not None else None
+    chosen = select_within_budget(results, max_size, args.max_latency_us)
+    if chosen is None:
+        raise SystemExit("No candidate fits the size/latency budget.")
+    print("Selected:\n  " + _describe(chosen))
+    if args.dry_run:
+        return
+
+    model = check_model(cache.load_model(chosen["key"]))  # never publish a model the app would mislabel
+    modeltest.publish_model(cache.model_path(chosen["key"]), out_path=args.out, bundle_dir=args.bundle_dir, model=model)
+    print(f"Published model {chosen['key'][:12]} to {args.out} and {args.bundle_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Process-wide holder for the career model.
+
+Streamlit re-executes main.py on every widget change, but imported modules
+stay in ``sys.modules`` for the life of the server process. Keeping the model
+here means it is unpickled once and shared by every session, instead of being
+reloaded on each rerun.
+
+The holder polls the artifact's mtime/size and, when they change, its SHA-256.
+A new version is loaded off to the side and swapped in with a single reference
+assignment, so predictions already running keep using the version they
+started with.
+"""
+import collections
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = "career_model.pkl"
+
+# Minimum number of seconds between two stat() calls on the artifact.
+DEFAULT_CHECK_INTERVAL = 2.0
+# Loads remembered in ModelHolder.history (metadata only, never the model)
+HISTORY_SIZE = 16
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Returns the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def model_nbytes(model):
+    """Estimates the in-memory size of a fitted tree model in bytes."""
+    if hasattr(model, "nbytes"):
+        return model.nbytes
+    total = 0
+    for estimator in getattr(model, "estimators_", [model]):
+        tree = getattr(estimator, "tree_", None)
+        if tree is None:
+            continue
+        state = tree.__getstate__()
+        total += state["nodes"].nbytes + state["values"].nbytes
+    return total
+
+
+def load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+class ModelVersion:
+    """An immutable snapshot of one loaded model artifact."""
+
+    def __init__(self, model, path, sha256, mtime, size, load_seconds, nbytes):
+        self.model = model
+        self.path = path
+        self.sha256 = sha256
+        self.mtime = mtime
+        self.size = size
+        self.load_seconds = load_seconds
+        self.nbytes = nbytes
+        self.loaded_at = time.time()
+
+    @property
+    def tag(self):
+        return self.sha256[:12]
+
+    def describe(self):
+        return (
+            f"model {self.tag} loaded in {self.load_seconds:.2f}s, "
+            f"{self.nbytes / 1e6:.1f} MB in memory"
+        )
+
+
+class ModelHolder:
+    """Loads a model artifact once and hot-swaps it when the file changes."""
+
+    def __init__(self, path=DEFAULT_MODEL_PATH, loader=load_pickle, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.path = path
+        self.loader = loader
+        self.check_interval = check_interval
+        self.history = collections.deque(maxlen=HISTORY_SIZE)
+        self._current = None
+        self._stat = None
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+
+    def get(self):
+        """Returns the current ModelVersion, reloading it if the artifact changed.
+
+        Raises FileNotFoundError if the artifact has never been loaded and is
+        missing. Once a version is loaded, a failed reload is logged and the
+        previous version keeps serving.
+        """
+        current = self._current
+        if current is not None and time.monotonic() < self._next_check:
+            return current
+
+        # Only one thread checks/reloads; the others keep serving the current version.
+        if not self._reload_lock.acquire(blocking=current is None):
+            return current
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                self._refresh()
+            except Exception:
+                if self._current is None:
+                    raise
+                logger.exception("Reloading %s failed; keeping model %s", self.path, self._current.tag)
+            return self._current
+        finally:
+            self._reload_lock.release()
+
+    def _refresh(self):
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if self._current is not None and stat_key == self._stat:
+            return
+
+        sha256 = file_sha256(self.path)
+        if self._current is not None and sha256 == self._current.sha256:
+            # Touched or rewritten with identical content: nothing to load.
+            self._stat = stat_key
+            return
+
+        start = time.perf_counter()
+        model = self.loader(self.path)
+        load_seconds = time.perf_counter() - start
+
+        version = ModelVersion(
+            model, self.path, sha256, st.st_mtime, st.st_size, load_seconds, model_nbytes(model)
+        )
+        # Metadata only: keeping the version would keep every replaced model alive
+        self.history.append({"tag": version.tag, "sha256": sha256, "loaded_at": version.loaded_at})
+        self._current = version
+        self._stat = stat_key
+        logger.info("Loaded %s: %s", self.path, version.describe())
+
+
+_holders = {}
+_holders_lock = threading.Lock()
+
+
+def get_model_holder(path=DEFAULT_MODEL_PATH, loader=load_pickle):
+    """Returns the process-wide ModelHolder for ``path``."""
+    key = os.path.abspath(path)
+    with _holders_lock:
+        holder = _holders.get(key)
+        if holder is None:
+            holder = _holders[key] = ModelHolder(path, loader=loader)
+        return holder
@@ -1,270 +1,194 @@
 # train_model.py
+import argparse
+import os
+import shutil
+import time
+from contextlib import contextmanager
 import numpy as np
+import sklearn
 from sklearn.ensemble import RandomForestClassifier
 import pickle
+from build_cache import DEFAULT_CACHE_DIR, BuildCache, content_key
+from career_rules import compile_career_rules
+from career_schema import CAREER_LABELS, FEATURE_NAMES, NUM_CAREERS, NUM_FEATURES, check_model
+from forest_bundle import export_forest, read_manifest as read_bundle_manifest
+from model_store import file_sha256
 
-# Define feature names and their order (CRUCIAL FOR CONSISTENCY)
-FEATURE_NAMES = [
-    "Age",
-    "Maths - Algebra", "Maths - Calculus", "Science - Biology", "Science - Chemistry",
-    "Science - Physics", "Computer Science - Programming", "Computer Science - Data Structures",
-    "History - Ancient", "History - Modern", "Economics - Microeconomics",
-    "Economics - Macroeconomics", "Literature - Fiction", "Literature - Poetry",
-    "Art - Painting", "Art - Sculpture",
-    "Problem Solving - Logical", "Problem Solving - Creative", "Creativity - Visual",
-    "Creativity - Innovation", "Communication - Written", "Communication - Verbal",
-    "Leadership - Team Management", "Leadership - Initiative",
-    "Technology - Artificial Intelligence", "Technology - Cybersecurity",
-    "Technology - Web Development", "Business - Marketing", "Business - Finance",
-    "Business - Management", "Art And Design - Visual Arts",
-    "Art And Design - Industrial Design", "Healthcare - Clinical Research",
-    "Healthcare - Patient Care", "Education - Primary/Secondary",
-    "Education - Higher Education", "Engineering - Mechanical",
-    "Engineering - Electrical", "Writing - Creative Writing", "Writing - Technical Writing",
-    "Enjoy solving complex problems?", "Prefer working with machines?",
-    "Interested in research?", "Enjoy working with people?", "Prefer working indoors?"
-]
-NUM_FEATURES = len(FEATURE_NAMES)
-
-X = []
-y = []
-
-# Career labels (indices for the y array)
-CAREER_OPTIONS = [
-    "Software Engineer", "Data Scientist", "Web Developer", "Graphic Designer",
-    "UX/UI Designer", "Marketing Manager", "Financial Analyst", "Product Manager",
-    "Business Analyst", "Human Resources Manager", "Teacher (Primary)", "Teacher (Secondary)",
-    "Professor", "Doctor (General)", "Doctor (Specialist)", "Nurse",
-    "Pharmacist", "Lawyer", "Journalist", "Technical Writer",
-    "Architect", "Civil Engineer", "Mechanical Engineer", "Electrical Engineer",
-    "Environmental Scientist", "Data Analyst", "Management Consultant"
-]
-
-NUM_CAREERS = len(CAREER_OPTIONS)
 SAMPLES_PER_CAREER = 150
+SEED = 42
+# Bump when the sampling code changes, so cached datasets are not reused.
+DATASET_VERSION = 1
+# Bump when the saved model changes without its parameters changing, so cached models are rebuilt.
+# 2: fit-time n_jobs/verbose/warm_start are reset before saving.
+MODEL_VERSION = 2
 
-def generate_random_input():
-    # Generate random input based on the number of features
-    return list(np.random.randint(1, 6, 15)) + list(np.random.randint(1, 6, 14)) + list(np.random.randint(0, 2, 5))
-
-
-
-# Rule-based data generation
-for i in range(NUM_CAREERS):
-    for _ in range(SAMPLES_PER_CAREER):
-        input_data = generate_random_input()
-        age = np.random.randint(18, 45)
-        career = CAREER_OPTIONS[i]
-
-        # Initialize a dictionary to hold feature values, including age
-        feature_values = {
-            "Age": age,
-            "Maths - Algebra": np.random.randint(1, 6), "Maths - Calculus": np.random.randint(1, 6),
-            "Science - Biology": np.random.randint(1, 6), "Science - Chemistry": np.random.randint(1, 6),
-            "Science - Physics": np.random.randint(1, 6), "Computer Science - Programming": np.random.randint(1, 6),
-            "Computer Science - Data Structures": np.random.randint(1, 6), "History - Ancient": np.random.randint(1, 6),
-            "History - Modern": np.random.randint(1, 6), "Economics - Microeconomics": np.random.randint(1, 6),
-            "Economics - Macroeconomics": np.random.randint(1, 6), "Literature - Fiction": np.random.randint(1, 6),
-            "Literature - Poetry": np.random.randint(1, 6), "Art - Painting": np.random.randint(1, 6),
-            "Art - Sculpture": np.random.randint(1, 6),
-            "Problem Solving - Logical": np.random.randint(1, 6), "Problem Solving - Creative":  np.random.randint(1, 6),
-            "Creativity - Visual": np.random.randint(1, 6), "Creativity - Innovation":  np.random.randint(1, 6),
-            "Communication - Written": np.random.randint(1, 6), "Communication - Verbal":  np.random.randint(1, 6),
-            "Leadership - Team Management":  np.random.randint(1, 6), "Leadership - Initiative":  np.random.randint(1, 6),
-            "Technology - Artificial Intelligence":  np.random.randint(0, 2), "Technology - Cybersecurity":  np.random.randint(0, 2),
-            "Technology - Web Development":  np.random.randint(0, 2), "Business - Marketing":  np.random.randint(0, 2),
-            "Business - Finance":  np.random.randint(0, 2), "Business - Management":  np.random.randint(0, 2),
-            "Art And Design - Visual Arts":  np.random.randint(0, 2), "Art And Design - Industrial Design":  np.random.randint(0, 2),
-            "Healthcare - Clinical Research":  np.random.randint(0, 2), "Healthcare - Patient Care":  np.random.randint(0, 2),
-            "Education - Primary/Secondary":  np.random.randint(0, 2), "Education - Higher Education":  np.random.randint(0, 2),
-            "Engineering - Mechanical":  np.random.randint(0, 2), "Engineering - Electrical":  np.random.randint(0, 2),
-            "Writing - Creative Writing":  np.random.randint(0, 2), "Writing - Technical Writing":  np.random.randint(0, 2),
-            "Enjoy solving complex problems?": np.random.choice([0, 1]),
-            "Prefer working with machines?": np.random.choice([0, 1]),
-            "Interested in research?": np.random.choice([0, 1]),
-            "Enjoy working with people?": np.random.choice([0, 1]),
-            "Prefer working indoors?": np.random.choice([0, 1]),
-        }
-
-        if career == "Software Engineer":
-            feature_values["Computer Science - Programming"] = np.random.randint(4, 6)
-            feature_values["Computer Science - Data Structures"] = np.random.randint(3, 6)
-            feature_values["Technology - Artificial Intelligence"] = np.random.randint(4, 6)
-            feature_values["Technology - Cybersecurity"] = np.random.randint(3, 6)
-            feature_values["Enjoy solving complex problems?"] = 1
-            feature_values["Prefer working with machines?"] = 1
-            feature_values["Maths - Algebra"] = np.random.randint(3,5)
-        elif career == "Data Scientist":
-            feature_values["Maths - Algebra"] = np.random.randint(4, 6)
-            feature_values["Research - Data Analysis"] = np.random.randint(4, 6)
-            feature_values["Computer Science - Programming"] = np.random.randint(4, 6)
-            feature_values["Technology - Artificial Intelligence"] = np.random.randint(4, 6)
-            feature_values["Enjoy solving complex problems?"] = 1
-            feature_values["Interested in research?"] = 1
-        elif career == "Web Developer":
-            feature_values["Computer Science - Programming"] = np.random.randint(4, 6)
-            feature_values["Technology - Artificial Intelligence"] = np.random.randint(4, 6)
-            feature_values["Designing - UI/UX"] = np.random.randint(3, 6)
-            feature_values["Designing - Graphic"] = np.random.randint(3, 6)
-            feature_values["Technology - Web Development"] = np.random.randint(3, 5)
-            feature_values["Prefer working with machines?"] = 1
-        elif career == "Graphic Designer":
-            feature_values["Designing - Graphic"] = np.random.randint(4, 6)
-            feature_values["Art - Painting"] = np.random.randint(4, 6)
-            feature_values["Art - Sculpture"] = np.random.randint(3, 6)
-            feature_values["Creativity - Visual"] = np.random.randint(4, 6)
-        elif career == "UX/UI Designer":
-            feature_values["Computer Science - Programming"] = np.random.randint(3, 5)
-            feature_values["Designing - UI/UX"] = np.random.randint(4, 6)
-            feature_values["Creativity - Visual"] = np.random.randint(4, 6)
-            feature_values["Creativity - Innovation"] = np.random.randint(3, 5)
-            feature_values["Technology - Web Development"] = np.random.randint(3, 5)
-        elif career == "Marketing Manager":
-            feature_values["Communication - Written"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Creativity - Innovation"] = np.random.randint(3, 6)
-            feature_values["Business - Marketing"] = np.random.randint(3, 5)
-            feature_values["Business - Management"] = np.random.randint(2, 4)
-        elif career == "Financial Analyst":
-            feature_values["Maths - Algebra"] = np.random.randint(4, 6)
-            feature_values["Research - Data Analysis"] = np.random.randint(3, 5)
-            feature_values["Business - Finance"] = np.random.randint(4, 6)
-            feature_values["Interested in research?"] = 1
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Product Manager":
-            feature_values["Computer Science - Programming"] = np.random.randint(3, 5)
-            feature_values["Communication - Verbal"] = np.random.randint(3, 5)
-            feature_values["Leadership - Team Management"] = np.random.randint(3, 5)
-            feature_values["Business - Management"] = np.random.randint(3, 5)
-            feature_values["Technology - Artificial Intelligence"] = np.random.randint(3, 5)
-        elif career == "Business Analyst":
-            feature_values["Maths - Algebra"] = np.random.randint(3, 5)
-            feature_values["Research - Data Analysis"] = np.random.randint(3, 5)
-            feature_values["Communication - Verbal"] = np.random.randint(3, 5)
-            feature_values["Business - Management"] = np.random.randint(3, 5)
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Human Resources Manager":
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Leadership - Team Management"] = np.random.randint(4, 6)
-            feature_values["Leadership - Initiative"] = np.random.randint(3, 5)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["Business - Management"] = np.random.randint(3, 5)
-        elif career == "Teacher (Primary)":
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Education - Primary/Secondary"] = np.random.randint(4, 6)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["Creativity - Visual"] = np.random.randint(3, 5)
-            feature_values["History - Ancient"] = np.random.randint(3, 5)
-        elif career == "Teacher (Secondary)":
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Education - Primary/Secondary"] = np.random.randint(4, 6)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["History - Ancient"] = np.random.randint(3, 5)
-            feature_values["Computer Science - Programming"] = np.random.randint(3, 5)
-        elif career == "Professor":
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Research - Literature Review"] = np.random.randint(4, 6)
-            feature_values["Education - Higher Education"] = np.random.randint(4, 6)
-            feature_values["Interested in research?"] = 1
-            #randomly select a subject
-            subject_features = ["Maths - Algebra", "Maths - Calculus", "Science - Biology", "Science - Chemistry",
-                                "Science - Physics", "Computer Science - Programming","Computer Science - Data Structures"]
-            chosen_subject = np.random.choice(subject_features)
-            feature_values[chosen_subject] = np.random.randint(4, 6)
-        elif career == "Doctor (General)":
-            feature_values["Science - Biology"] = np.random.randint(4, 6)
-            feature_values["Healthcare - Clinical Research"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(3, 5)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Doctor (Specialist)":
-            feature_values["Science - Biology"] = np.random.randint(4, 6)
-            feature_values["Healthcare - Clinical Research"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(3, 5)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["Interested in research?"] = 1
-        elif career == "Nurse":
-            feature_values["Science - Biology"] = np.random.randint(3, 5)
-            feature_values["Healthcare - Patient Care"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Enjoy working with people?"] = 1
-            feature_values["Leadership - Team Management"] = np.random.randint(2, 4)
-        elif career == "Pharmacist":
-            feature_values["Science - Chemistry"] = np.random.randint(3, 5)
-            feature_values["Healthcare - Patient Care"] = np.random.randint(4, 6)
-            feature_values["Maths - Algebra"] = np.random.randint(3, 5)
-            feature_values["Research - Data Analysis"] = np.random.randint(2, 4)
-        elif career == "Lawyer":
-            feature_values["History - Ancient"] = np.random.randint(4, 6)
-            feature_values["Communication - Written"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Problem Solving - Logical"] = 1
-            feature_values["Research - Literature Review"] = np.random.randint(3, 5)
-        elif career == "Journalist":
-            feature_values["History - Ancient"] = np.random.randint(3, 5)
-            feature_values["Communication - Written"] = np.random.randint(4, 6)
-            feature_values["Communication - Verbal"] = np.random.randint(4, 6)
-            feature_values["Writing - Creative Writing"] = np.random.randint(4, 6)
-            feature_values["Research - Literature Review"] = np.random.randint(3, 5)
-        elif career == "Technical Writer":
-            feature_values["Computer Science - Programming"] = np.random.randint(3, 5)
-            feature_values["Communication - Written"] = np.random.randint(4, 6)
-            feature_values["Writing - Technical Writing"] = np.random.randint(4, 6)
-            feature_values["Research - Data Analysis"] = np.random.randint(3, 5)
-        elif career == "Architect":
-            feature_values["Maths - Algebra"] = np.random.randint(3, 5)
-            feature_values["Art - Painting"] = np.random.randint(3, 5)
-            feature_values["Designing - UI/UX"] = np.random.randint(4, 6)
-            feature_values["Engineering - Mechanical"] = np.random.randint(3, 5)
-            feature_values["Creativity - Visual"] = np.random.randint(3, 5)
-        elif career == "Civil Engineer":
-            feature_values["Maths - Calculus"] = np.random.randint(4, 6)
-            feature_values["Science - Physics"] = np.random.randint(3, 5)
-            feature_values["Engineering - Mechanical"] = np.random.randint(4, 6)
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Mechanical Engineer":
-            feature_values["Maths - Calculus"] = np.random.randint(4, 6)
-            feature_values["Science - Physics"] = np.random.randint(4, 6)
-            feature_values["Engineering - Mechanical"] = np.random.randint(4, 6)
-            feature_values["Prefer working with machines?"] = 1
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Electrical Engineer":
-            feature_values["Maths - Calculus"] = np.random.randint(4, 6)
-            feature_values["Science - Physics"] = np.random.randint(4, 6)
-            feature_values["Computer Science - Programming"] = np.random.randint(2, 4)
-            feature_values["Engineering - Electrical"] = np.random.randint(4, 6)
-            feature_values["Prefer working with machines?"] = 1
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Environmental Scientist":
-            feature_values["Science - Biology"] = np.random.randint(4, 6)
-            feature_values["Research - Literature Review"] = np.random.randint(3, 5)
-            feature_values["Engineering - Mechanical"] = np.random.randint(4, 6)
-            feature_values["Interested in research?"] = 1
-        elif career == "Data Analyst":
-            feature_values["Maths - Algebra"] = np.random.randint(4, 6)
-            feature_values["Computer Science - Programming"] = np.random.randint(3, 5)
-            feature_values["Research - Data Analysis"] = np.random.randint(4, 6)
-            feature_values["Problem Solving - Logical"] = 1
-        elif career == "Management Consultant":
-            feature_values["Economics - Microeconomics"] = np.random.randint(3, 5)
-            feature_values["Communication - Verbal"] = np.random.randint(3, 5)
-            feature_values["Business - Management"] = np.random.randint(3, 5)
-
-        # Create the input vector in the correct order
-        ordered_input_data = [feature_values[name] for name in FEATURE_NAMES]
-        X.append(ordered_input_data)
-        y.append(i)
-
-# Convert to NumPy arrays
-X = np.array(X)
-y = np.array(y)
-
-# Create and train the model
-model = RandomForestClassifier(random_state=42)
-model.fit(X, y)
-
-# Save the trained model
-with open("career_model.pkl", "wb") as f:
-    pickle.dump(model, f)
-
-print(f"Trained and saved a new career model with {NUM_FEATURES} features!")
+MODEL_PARAMS = {"random_state": 42}
+# Estimator parameters that don't change the fitted model
+NON_SEMANTIC_PARAMS = ("n_jobs", "verbose")
+
+# Baseline sampling range of every feature, [low, high) as in Generator.integers:
+# age, 1-5 subject and skill scores, then 0/1 field interests and preferences.
+BASE_LOW = np.array([18] + [1] * 23 + [0] * 16 + [0] * 5, dtype=np.int8)
+BASE_HIGH = np.array([45] + [6] * 23 + [2] * 16 + [2] * 5, dtype=np.int8)
+
+
+def compile_rules():
+    """Compiles the career rule table (career_rules.py) against this feature schema."""
+    return compile_career_rules(CAREER_LABELS, FEATURE_NAMES, BASE_LOW, BASE_HIGH)
+
+
+def generate_career_samples(career_index, n_samples, rng, rules):
+    """Returns an (n_samples, NUM_FEATURES) int8 matrix of profiles for one career."""
+    X = rng.integers(rules.low[career_index], rules.high[career_index], size=(n_samples, NUM_FEATURES), dtype=np.int8)
+    for features, low, high in rules.choices[career_index]:
+        chosen = features[rng.integers(0, len(features), n_samples)]
+        X[np.arange(n_samples), chosen] = rng.integers(low, high, n_samples, dtype=np.int8)
+    return X
+
+
+def generate_dataset(samples_per_career=SAMPLES_PER_CAREER, seed=SEED):
+    """Generates the rule-based training set as a contiguous int8 matrix and labels.
+
+    Every career draws from its own child of ``seed``, so a career's samples
+    don't depend on the order or number of careers generated before it.
+    """
+    rules = compile_rules()
+    X = np.empty((NUM_CAREERS * samples_per_career, NUM_FEATURES), dtype=np.int8)
+    y = np.repeat(np.arange(NUM_CAREERS), samples_per_career)
+    seeds = np.random.SeedSequence(seed).spawn(NUM_CAREERS)
+    for i in range(NUM_CAREERS):
+        rows = slice(i * samples_per_career, (i + 1) * samples_per_career)
+        X[rows] = generate_career_samples(i, samples_per_career, np.random.default_rng(seeds[i]), rules)
+    return X, y
+
+
+def dataset_key(samples_per_career, seed):
+    """Cache key of the dataset generate_dataset() would produce."""
+    return content_key(
+        version=DATASET_VERSION, rules=compile_rules().digest, samples_per_career=samples_per_career, seed=seed
+    )
+
+
+def model_key(data_key, model):
+    """Cache key of ``model`` fitted on the dataset with key ``data_key``."""
+    params = {k: v for k, v in model.get_params().items() if k not in NON_SEMANTIC_PARAMS}
+    return content_key(version=MODEL_VERSION, dataset=data_key, params=params, sklearn=sklearn.__version__)
+
+
+def publish_model(model_path, out_path="career_model.pkl", bundle_dir="career_model_forest", model=None):
+    """Copies a built model to ``out_path`` and exports its bundle, skipping whatever is already current.
+
+    Pass the already loaded ``model`` to avoid unpickling it again for the export.
+    """
+    sha256 = file_sha256(model_path)
+    if not (os.path.exists(out_path) and file_sha256(out_path) == sha256):
+        # Copy then rename so a running app never loads a half-written file
+        shutil.copyfile(model_path, out_path + ".tmp")
+        os.replace(out_path + ".tmp", out_path)
+
+    try:
+        bundle_current = read_bundle_manifest(bundle_dir).get("source_sha256") == sha256
+    except (OSError, ValueError):
+        bundle_current = False
+    if not bundle_current:
+        # Flat-array copy of the same forest, memory-mapped by main.py
+        if model is None:
+            with open(model_path, "rb") as f:
+                model = pickle.load(f)
+        export_forest(model, bundle_dir, source_sha256=sha256)
+
+
+class StageTimer:
+    """Records wall-clock time per pipeline stage."""
+
+    def __init__(self):
+        self.seconds = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self):
+        return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.seconds.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and save the career model.")
+    parser.add_argument("--dataset", help="train on a shard directory written by dataset_shards.py")
+    parser.add_argument("--samples-per-career", type=int, default=SAMPLES_PER_CAREER)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--n-jobs", type=int, default=-1, help="cores used to fit trees (default: all)")
+    parser.add_argument("--add-trees", type=int, default=0,
+                        help="grow the current career_model.pkl by this many trees with warm start")
+    parser.add_argument("--out", default="career_model.pkl")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--force", action="store_true", help="ignore cached artifacts and rebuild them")
+    parser.add_argument("--verbose", action="store_true", help="report per-tree fitting progress")
+    args = parser.parse_args()
+
+    cache = BuildCache(args.cache_dir)
+    timer = StageTimer()
+
+    if args.dataset:
+        from dataset_shards import read_dataset, read_manifest  # imports this module
+        shards = read_manifest(args.dataset)
+        data_key = content_key(
+            source="shards", rules=shards["rules_sha256"], samples_per_career=shards["samples_per_career"],
+            seed=shards["seed"], shard_rows=shards["shard_rows"],
+        )
+    else:
+        data_key = dataset_key(args.samples_per_career, args.seed)
+
+    if args.add_trees:
+        with timer.stage("load"):
+            with open(args.out, "rb") as f:
+                model = pickle.load(f)
+        key = content_key(
+            version=MODEL_VERSION, base=file_sha256(args.out), dataset=data_key, add_trees=args.add_trees
+        )
+        model.set_params(warm_start=True, n_estimators=len(model.estimators_) + args.add_trees)
+    else:
+        model = RandomForestClassifier(**MODEL_PARAMS)
+        key = model_key(data_key, model)
+    model.set_params(n_jobs=args.n_jobs, verbose=int(args.verbose))
+
+    if cache.has_model(key) and not args.force:
+        print(f"Model {key[:12]} is cached; skipping data generation and training.")
+        model = None
+    else:
+        with timer.stage("generate"):
+            if args.dataset:
+                X, y = read_dataset(args.dataset)
+            else:
+                cached = None if args.force else cache.load_dataset(data_key)
+                if cached is not None:
+                    print(f"Dataset {data_key[:12]} is cached; retraining the model only.")
+                    X, y = cached
+                else:
+                    X, y = generate_dataset(args.samples_per_career, args.seed)
+                    cache.store_dataset(data_key, X, y)
+
+        # Create and train the model (warm start only fits the added trees)
+        with timer.stage("fit"):
+            model.fit(X, y)
+        # Fit-time settings only: a pickled n_jobs=-1 would send every
+        # single-row predict_proba through joblib threads.
+        model.set_params(n_jobs=None, verbose=0, warm_start=False)
+        check_model(model)  # never publish a model the app would mislabel
+        with timer.stage("serialize"):
+            cache.store_model(key, model)
+
+    # Save the trained model
+    with timer.stage("publish"):
+        publish_model(cache.model_path(key), out_path=args.out, model=model)
+
+    print(f"Saved career model {key[:12]} with {NUM_FEATURES} features!")
+    print(f"Stage timings: {timer.report()}")
+
+
+if __name__ == "__main__":
+    main()
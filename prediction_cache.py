@@ -0,0 +1,168 @@
+"""Host-wide prediction cache shared by every server process, kept in SQLite.
+
+CareerRanker's in-memory LRU only helps the process that filled it and is
+lost on every restart. This cache sits behind it: all Streamlit processes
+on a host open the same SQLite file, so a profile scored once by any of them
+is answered from disk by all of them, and it survives restarts.
+
+Rows are keyed by (model SHA-256, packed profile), so a result is never
+served for a model other than the one that produced it. The model hash is
+that of the pickled forest, which a bundle's manifest records as
+``source_sha256`` (see ``career_ranking.model_identity``). Processes serving
+the pickle and processes serving its bundle therefore share entries instead
+of deleting each other's. Opening the cache for a new model version deletes
+the rows of every other version, and a changed artifact therefore
+invalidates the cache on its own.
+
+The table is bounded: inserts beyond ``max_entries`` evict the least
+recently used rows. A hit never waits for the write lock. Its new
+``last_used`` stamp is kept in memory and written with the next insert, or
+when ``STAMP_BATCH`` stamps are pending, and in that case only if the lock
+is free.
+
+The database runs in WAL mode so readers never block the single writer.
+Every call borrows a connection from a small pool and returns it, since
+Streamlit runs each script run in a new thread and per-thread connections
+would pile up, never closed. At most ``POOL_SIZE`` idle connections are
+kept; extra ones opened under a burst are closed when they are returned.
+"""
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100000
+# Inserts between two checks of the table size.
+EVICT_EVERY = 256
+# Seconds a connection waits for another process's write lock.
+BUSY_TIMEOUT = 5.0
+# Pending hit stamps that trigger a write without waiting for the next insert.
+STAMP_BATCH = 256
+# Idle connections kept open for reuse.
+POOL_SIZE = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    model TEXT NOT NULL,
+    profile BLOB NOT NULL,
+    ranking TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, profile)
+);
+CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used);
+"""
+
+
+class SharedPredictionCache:
+    """An LRU-bounded SQLite table of rankings for one model version."""
+
+    def __init__(self, path, model_sha256, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.model_sha256 = model_sha256
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._idle = queue.LifoQueue(POOL_SIZE)
+        self._inserts = 0
+        self._stamps = {}  # packed profile -> last hit time, not yet written
+        self._stamps_lock = threading.Lock()
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+            stale = conn.execute("DELETE FROM predictions WHERE model != ?", (model_sha256,)).rowcount
+        if stale:
+            logger.info("Dropped %d cached predictions of older models from %s", stale, path)
+
+    @contextmanager
+    def _connection(self):
+        """Borrows an idle connection, or opens one, and returns it to the pool afterwards."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def get(self, key):
+        """Returns the cached ranking for a packed profile, or None."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT ranking FROM predictions WHERE model = ? AND profile = ?", (self.model_sha256, key)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._stamps_lock:
+                self._stamps[key] = time.time()
+                flush = len(self._stamps) >= STAMP_BATCH
+            if flush:
+                self._write_stamps(conn, wait=False)
+        return tuple(tuple(pair) for pair in json.loads(row[0]))
+
+    def _write_stamps(self, conn, wait=True):
+        """Writes the pending hit stamps; without ``wait`` it gives up at once if the lock is taken."""
+        with self._stamps_lock:
+            stamps, self._stamps = self._stamps, {}
+        if not stamps:
+            return
+        if not wait:
+            conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            conn.execute("BEGIN IMMEDIATE")  # one transaction for the batch; fails fast without ``wait``
+            try:
+                conn.executemany(
+                    "UPDATE predictions SET last_used = ? WHERE model = ? AND profile = ?",
+                    [(used, self.model_sha256, key) for key, used in stamps.items()],
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError:
+            # Another process holds the write lock; keep the stamps for the next write
+            with self._stamps_lock:
+                for key, used in stamps.items():
+                    self._stamps.setdefault(key, used)
+        finally:
+            if not wait:
+                conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT * 1000)}")
+
+    def put(self, key, ranking):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO predictions (model, profile, ranking, last_used) VALUES (?, ?, ?, ?)",
+                (self.model_sha256, key, json.dumps(ranking), time.time()),
+            )
+            self._write_stamps(conn)
+        self._inserts += 1
+        if self._inserts % EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self):
+        """Deletes the least recently used rows beyond ``max_entries``."""
+        with self._connection() as conn:
+            excess = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM predictions WHERE rowid IN "
+                    "(SELECT rowid FROM predictions ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+        return max(excess, 0)
+
+    def __len__(self):
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
@@ -0,0 +1,224 @@
+"""Micro-batching of single-row predictions from concurrent sessions.
+
+Every Streamlit session runs its script in its own thread, and each Analyze
+click scores a single row. When a whole classroom clicks at once, those
+threads contend for the GIL, each paying the full per-call overhead for one
+row. MicroBatcher puts a queue in front of the model instead. A single
+scoring thread takes the first waiting request, gathers more for up to
+``max_wait`` seconds or until it holds ``max_batch_size`` rows, and scores
+them all in one vectorized ``predict_proba`` call. Each caller gets its row
+back through a ``concurrent.futures.Future``.
+
+MicroBatcher has the classifier's ``predict_proba``/``predict``/``classes_``
+API, so it drop-in replaces the model anywhere, for example in CareerRanker.
+``metrics.snapshot()`` reports batch sizes, the queue depth each batch left
+behind and how long requests waited, which is what ``max_wait`` and
+``max_batch_size`` are tuned against.
+
+``close()`` scores what is already queued and stops the scoring thread. A
+caller that still holds a closed batcher, such as a session that picked up
+the ranker just before a model swap, is scored directly instead of queueing
+a request nobody would answer. A caller also never waits more than
+``result_timeout`` seconds for its row.
+
+Usage (throughput of N concurrent single-row callers, direct vs batched):
+    python prediction_scheduler.py --threads 32 --requests 200
+"""
+import argparse
+import collections
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from forest_engine import load_forest_engine, random_profiles
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT = 0.002
+# Longest a caller waits for its row before giving up
+DEFAULT_RESULT_TIMEOUT = 30.0
+# Batches kept for the rolling metrics.
+METRICS_WINDOW = 1024
+
+_STOP = object()
+
+
+class BatchMetrics:
+    """Rolling statistics over the most recent batches."""
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.batches = 0
+        self.rows = 0
+        self.batch_sizes = collections.deque(maxlen=window)
+        self.queue_depths = collections.deque(maxlen=window)
+        self.wait_us = collections.deque(maxlen=window * 8)
+
+    def record(self, batch_size, queue_depth, waits):
+        self.batches += 1
+        self.rows += batch_size
+        self.batch_sizes.append(batch_size)
+        self.queue_depths.append(queue_depth)
+        self.wait_us.extend(waits)
+
+    def snapshot(self):
+        sizes, depths, waits = list(self.batch_sizes), list(self.queue_depths), list(self.wait_us)
+        wait_p50, wait_p99 = np.percentile(waits, [50, 99]) if waits else (0.0, 0.0)
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_size": float(np.mean(sizes)) if sizes else 0.0,
+            "max_batch_size": max(sizes, default=0),
+            "max_queue_depth": max(depths, default=0),
+            "wait_p50_us": float(wait_p50),
+            "wait_p99_us": float(wait_p99),
+        }
+
+    def describe(self):
+        s = self.snapshot()
+        return (
+            f"{s['batches']} batches, mean size {s['mean_batch_size']:.1f}, "
+            f"max queue {s['max_queue_depth']}, wait p99 {s['wait_p99_us'] / 1e3:.1f} ms"
+        )
+
+
+class MicroBatcher:
+    """Scores single-row requests from many threads in shared batches."""
+
+    def __init__(self, model, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT,
+                 result_timeout=DEFAULT_RESULT_TIMEOUT):
+        self.model = model
+        self.classes_ = model.classes_
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.result_timeout = result_timeout
+        self.metrics = BatchMetrics()
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, x):
+        """Queues one row; the returned Future resolves to its probability row."""
+        future = Future()
+        x = np.asarray(x).reshape(-1)
+        with self._close_lock:
+            if not self._closed:
+                self._queue.put((x, future, time.perf_counter()))
+                return future
+        # Closed: nothing would answer the queue, so score in the caller's thread
+        try:
+            future.set_result(self.model.predict_proba(x.reshape(1, -1))[0])
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def predict_proba(self, X):
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        futures = [self.submit(row) for row in X]
+        return np.vstack([future.result(timeout=self.result_timeout) for future in futures])
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+    def close(self):
+        """Scores the requests already queued, then stops the scoring thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        # Nothing is queued after _STOP, but never leave a caller waiting
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item[1].set_exception(RuntimeError("MicroBatcher closed before scoring this request"))
+
+    def _collect(self):
+        """Blocks for one request, then gathers more until the batch is full or due."""
+        first = self._queue.get()
+        if first is _STOP:
+            return None, True
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            if not batch:
+                continue
+            queue_depth = self._queue.qsize()
+            started = time.perf_counter()
+            try:
+                proba = self.model.predict_proba(np.vstack([x for x, _, _ in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            for row, (_, future, _) in zip(proba, batch):
+                future.set_result(row)
+            self.metrics.record(len(batch), queue_depth, [(started - t) * 1e6 for _, _, t in batch])
+
+
+def run_concurrent_clients(predict, rows, n_threads):
+    """Calls ``predict`` on one row at a time from ``n_threads`` threads; returns seconds."""
+    chunks = np.array_split(rows, n_threads)
+    threads = [
+        threading.Thread(target=lambda chunk=chunk: [predict(row.reshape(1, -1)) for row in chunk])
+        for chunk in chunks
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare direct and micro-batched scoring under concurrency.")
+    parser.add_argument("--model", default="career_model.pkl", help="pickled forest or bundle directory")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="single-row requests per thread")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1e3)
+    args = parser.parse_args()
+
+    rows = random_profiles(args.threads * args.requests, seed=0)
+    models = {"engine": load_forest_engine(args.model)}
+    if args.model.endswith(".pkl"):
+        with open(args.model, "rb") as f:
+            models["sklearn"] = pickle.load(f)
+
+    for name, model in models.items():
+        model.predict(rows[:1])  # warm-up (JIT compilation, lazy imports)
+        elapsed = run_concurrent_clients(model.predict, rows, args.threads)
+        print(f"{name:8s} direct   {len(rows) / elapsed:10,.0f} rows/s")
+        batcher = MicroBatcher(model, args.max_batch_size, args.max_wait_ms / 1e3)
+        elapsed = run_concurrent_clients(batcher.predict, rows, args.threads)
+        batcher.close()
+        print(f"{name:8s} batched  {len(rows) / elapsed:10,.0f} rows/s  ({batcher.metrics.describe()})")
+
+
+if __name__ == "__main__":
+    main()
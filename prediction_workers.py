@@ -0,0 +1,271 @@
+"""Out-of-process prediction workers.
+
+Scoring in the Streamlit process shares one interpreter with every session's
+script thread, so a burst of CPU-bound predictions holds the GIL and stalls
+the UI reruns of everyone else. PredictionWorkerPool moves inference into a
+pool of worker processes:
+
+* Each worker opens the model once. A forest bundle is memory-mapped, so
+  all workers share one page-cache copy of the arrays. Workers are pinned to
+  the version the parent loaded: given its SHA-256, a worker that finds a
+  different artifact at the path refuses to start. Results are therefore
+  never cached under the wrong version. A new artifact gets a new pool
+  (career_ranking.get_ranker).
+* Each worker talks to the server process over its own duplex Pipe.
+  Requests go to the worker with the fewest requests in flight, and one
+  receiver thread per worker resolves the callers' Futures.
+* At most ``max_pending`` requests are in flight. Beyond that, ``submit``
+  waits up to ``submit_timeout`` seconds for a free slot and then raises
+  PoolOverloaded, so a burst gets backpressure instead of an unbounded
+  queue.
+
+``close()`` stops sending requests to the workers, lets the ones in flight
+finish and then stops the workers. A pool given the in-process ``model``
+scores later requests with it, so a caller that still holds a replaced
+ranker, such as a long batch, keeps getting answers after the swap.
+
+The pool has the classifier's ``predict_proba``/``predict``/``classes_``
+API and can stand in for the model in CareerRanker. Workers are started
+with the "spawn" method, which is safe from a multi-threaded server.
+
+Usage (throughput of N threads scoring single rows, in-process vs pool):
+    python prediction_workers.py career_model.pkl --workers 4 --threads 32
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from career_schema import load_career_model
+from forest_bundle import MANIFEST_NAME
+from forest_engine import load_forest_engine, random_profiles
+from model_store import file_sha256
+from prediction_scheduler import run_concurrent_clients
+
+DEFAULT_MAX_PENDING = 256
+DEFAULT_SUBMIT_TIMEOUT = 5.0
+# Seconds close() waits for the requests in flight before stopping the workers
+DRAIN_TIMEOUT = 30.0
+# Batches larger than this are split across the workers.
+SPLIT_ROWS = 1024
+
+
+class PoolOverloaded(RuntimeError):
+    """Raised when no request slot frees up within ``submit_timeout``."""
+
+
+def _worker_main(path, sha256, conn):
+    try:
+        model = load_career_model(path)
+        # Hashed after loading, so a swap during the load is caught too
+        if sha256 is not None and file_sha256(path) != sha256:
+            raise RuntimeError(f"{path} is no longer model {sha256[:12]}")
+    except Exception as e:
+        conn.send(("error", None, f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+    conn.send(("ready", model.classes_, None))
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        request_id, X = message
+        try:
+            conn.send((request_id, model.predict_proba(X), None))
+        except Exception as e:
+            conn.send((request_id, None, f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.send_lock = threading.Lock()
+        self.pending = {}
+        self.alive = True
+        self.receiver = None
+
+
+class PredictionWorkerPool:
+    """predict/predict_proba served by a pool of worker processes.
+
+    With ``sha256`` (a ModelVersion's) every worker must load exactly that
+    artifact, or the pool fails to start with a RuntimeError. With ``model``
+    (the same version, loaded in-process) requests submitted after
+    ``close()`` are scored in the caller's thread instead of failing.
+    """
+
+    def __init__(self, path, n_workers=None, max_pending=DEFAULT_MAX_PENDING, submit_timeout=DEFAULT_SUBMIT_TIMEOUT,
+                 sha256=None, model=None):
+        if os.path.isdir(path):
+            path = os.path.join(path, MANIFEST_NAME)  # a bundle's version is its manifest's hash
+        self.path = path
+        self.sha256 = sha256
+        self.model = model
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.submit_timeout = submit_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        ctx = multiprocessing.get_context("spawn")
+        self._workers = []
+        for i in range(self.n_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker_main, args=(path, sha256, child_conn), name=f"prediction-worker-{i}", daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(_Worker(process, parent_conn))
+
+        for worker in self._workers:
+            try:
+                status, classes, error = worker.conn.recv()  # wait until every worker has the model
+            except EOFError:
+                status, error = "error", "exited"
+            if status != "ready":
+                self.close()
+                raise RuntimeError(f"{worker.process.name} failed to load {path}: {error}")
+            self.classes_ = classes
+        for worker in self._workers:
+            worker.receiver = threading.Thread(
+                target=self._receive, args=(worker,), name=f"{worker.process.name}-rx", daemon=True
+            )
+            worker.receiver.start()
+
+    @property
+    def in_flight(self):
+        return sum(len(worker.pending) for worker in self._workers)
+
+    def submit(self, X):
+        """Sends ``X`` to the least busy worker; the Future resolves to its probabilities."""
+        if self._closed:
+            return self._submit_closed(X)
+        if not self._slots.acquire(timeout=self.submit_timeout):
+            raise PoolOverloaded(f"{self.in_flight} predictions already in flight.")
+        future = Future()
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                live = [worker for worker in self._workers if worker.alive]
+                if not live:
+                    self._slots.release()
+                    raise RuntimeError("All prediction workers have exited.")
+                worker = min(live, key=lambda w: len(w.pending))
+                request_id = next(self._ids)
+                worker.pending[request_id] = future
+        if closed:
+            self._slots.release()
+            return self._submit_closed(X)
+        try:
+            with worker.send_lock:
+                worker.conn.send((request_id, np.asarray(X)))
+        except (OSError, ValueError) as e:
+            self._resolve(worker, request_id, error=f"sending to {worker.process.name} failed: {e}")
+        return future
+
+    def _submit_closed(self, X):
+        """Scores ``X`` with the in-process model once the workers are gone."""
+        if self.model is None:
+            raise RuntimeError("The prediction pool is closed.")
+        future = Future()
+        try:
+            future.set_result(self.model.predict_proba(np.asarray(X)))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _resolve(self, worker, request_id, proba=None, error=None):
+        with self._lock:
+            future = worker.pending.pop(request_id, None)
+        if future is None:
+            return
+        self._slots.release()
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        else:
+            future.set_result(proba)
+
+    def _receive(self, worker):
+        while True:
+            try:
+                request_id, proba, error = worker.conn.recv()
+            except (EOFError, OSError):
+                break
+            self._resolve(worker, request_id, proba, error)
+        worker.alive = False
+        for request_id in list(worker.pending):
+            self._resolve(worker, request_id, error=f"{worker.process.name} exited.")
+
+    def predict_proba(self, X):
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[0] <= SPLIT_ROWS:
+            return self.submit(X).result()
+        futures = [self.submit(chunk) for chunk in np.array_split(X, min(self.n_workers, -(-X.shape[0] // SPLIT_ROWS)))]
+        return np.vstack([future.result() for future in futures])
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+    def close(self):
+        """Stops taking requests, lets those in flight finish, then stops the workers."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        # A worker answers everything sent before its stop message, then exits;
+        # its receiver resolves those answers and ends at the EOF.
+        for worker in self._workers:
+            if worker.alive:
+                with worker.send_lock:
+                    try:
+                        worker.conn.send(None)
+                    except (OSError, ValueError):
+                        pass
+        deadline = time.monotonic() + DRAIN_TIMEOUT
+        for worker in self._workers:
+            if worker.receiver is not None:
+                worker.receiver.join(timeout=max(deadline - time.monotonic(), 0))
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare in-process and worker-pool scoring under concurrency.")
+    parser.add_argument("model", help="pickled forest or bundle directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="single-row requests per thread")
+    args = parser.parse_args()
+
+    rows = random_profiles(args.threads * args.requests, seed=0)
+    model = load_forest_engine(args.model)
+    model.predict(rows[:1])  # warm-up (JIT compilation, lazy imports)
+    elapsed = run_concurrent_clients(model.predict, rows, args.threads)
+    print(f"in-process  {len(rows) / elapsed:10,.0f} rows/s")
+
+    start = time.perf_counter()
+    pool = PredictionWorkerPool(args.model, args.workers)
+    print(f"started {pool.n_workers} workers in {time.perf_counter() - start:.1f}s")
+    pool.predict(rows[:1])
+    elapsed = run_concurrent_clients(pool.predict, rows, args.threads)
+    mismatches = int(np.count_nonzero(pool.predict_proba(rows) != model.predict_proba(rows)))
+    pool.close()
+    print(f"worker pool {len(rows) / elapsed:10,.0f} rows/s  (parity: {mismatches} mismatching values)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Salary and outlook table behind the salary page, parsed once per process.
+
+The page used to split and strip every ``CAREER_INFO[...]["salary"]`` string
+on each rerun. It also turned anything that was not a range into a salary of
+0 and re-sorted a copy of the table for each filter choice. A SalaryCatalog
+parses the strings once into integer columns. Each filter (an outlook, or
+"All") keeps a boolean mask over the rows, and each sort choice keeps its row
+order, so a view is one index lookup on the cached table.
+
+Salaries must look like ``"$60,000 - $120,000"``, and a trailing ``+``
+marks an open-ended maximum. Careers whose salary is missing or is not such
+a range, such as ``"Highly variable"``, are left out of the table. They are
+listed in ``invalid`` and logged, so the page can name them instead of
+charting a salary of 0.
+
+The page draws the chart from ``chart_spec()``, a Vega-Lite spec built once
+per catalog. The outlook filter and the sort choice are Vega-Lite params
+bound to select inputs. The rows carry their position in every sort order,
+so the browser filters and re-sorts the bars itself, with no script rerun
+and nothing sent from the server.
+
+``get_salary_catalog`` keeps one catalog, and so one chart spec, per
+process. It is rebuilt only when a career's salary or outlook changes.
+"""
+import json
+import logging
+import re
+import threading
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from career_info import CAREER_INFO
+
+logger = logging.getLogger(__name__)
+
+SALARY_RANGE = re.compile(r"\$(\d{1,3}(?:,\d{3})*) - \$(\d{1,3}(?:,\d{3})*)(\+?)")
+
+ALL_OUTLOOKS = "All"
+# Sort choices, in the order the page offers them: (column, ascending), or None for catalog order
+SORT_ORDERS = {
+    "None": None,
+    "Min Salary (Asc)": ("Min Salary", True),
+    "Min Salary (Desc)": ("Min Salary", False),
+    "Max Salary (Asc)": ("Max Salary", True),
+    "Max Salary (Desc)": ("Max Salary", False),
+}
+
+
+def parse_salary(text):
+    """Returns (min, max, open_ended) of a "$min - $max" range; raises ValueError otherwise."""
+    match = SALARY_RANGE.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"not a '$min - $max' range: {text!r}")
+    low, high = (int(group.replace(",", "")) for group in match.group(1, 2))
+    if low > high:
+        raise ValueError(f"minimum above maximum: {text!r}")
+    return low, high, match.group(3) == "+"
+
+
+def catalog_key(info):
+    """The fields the catalog is built from; a different key means a different catalog."""
+    return tuple((career, details.get("salary"), details.get("outlook")) for career, details in info.items())
+
+
+class SalaryCatalog:
+    """Parsed salary ranges with precomputed outlook masks and sort orders."""
+
+    def __init__(self, info):
+        self.key = catalog_key(info)
+        self.invalid = {}
+        rows = []
+        for career, salary, outlook in self.key:
+            try:
+                if not isinstance(salary, str):
+                    raise ValueError("missing salary")
+                low, high, open_ended = parse_salary(salary)
+            except ValueError as e:
+                self.invalid[career] = str(e)
+                continue
+            rows.append((career, low, high, open_ended, outlook or "Unknown"))
+        self.table = pd.DataFrame(
+            rows, columns=["Career", "Min Salary", "Max Salary", "Open-ended", "Outlook"]
+        ).astype({"Min Salary": np.int64, "Max Salary": np.int64, "Open-ended": bool})
+
+        self.outlooks = sorted(self.table["Outlook"].unique())
+        outlook = self.table["Outlook"].to_numpy()
+        self.outlook_masks = {ALL_OUTLOOKS: np.ones(len(self.table), dtype=bool)}
+        self.outlook_masks.update({name: outlook == name for name in self.outlooks})
+
+        self.sort_orders = {}
+        for label, order in SORT_ORDERS.items():
+            if order is None:
+                self.sort_orders[label] = np.arange(len(self.table))
+            else:
+                # Stable either way, so equal salaries keep catalog order
+                column = self.table[order[0]].to_numpy()
+                self.sort_orders[label] = np.argsort(column if order[1] else -column, kind="stable")
+        self._chart_spec = None
+
+    def rows(self, outlook=ALL_OUTLOOKS, sort_by="None"):
+        """Row positions of ``outlook`` careers (or all), in ``sort_by`` order."""
+        order = self.sort_orders[sort_by]
+        return order[self.outlook_masks[outlook][order]]
+
+    def view(self, outlook=ALL_OUTLOOKS, sort_by="None"):
+        """The table filtered to ``outlook`` and ordered by ``sort_by``."""
+        return self.table.iloc[self.rows(outlook, sort_by)]
+
+    def chart_spec(self):
+        """Vega-Lite spec of the salary chart; its filter and sort run in the browser."""
+        if self._chart_spec is None:
+            outlook = alt.param(
+                name="outlook", value=ALL_OUTLOOKS,
+                bind=alt.binding_select(options=[ALL_OUTLOOKS] + self.outlooks, name="🔍 Filter by Career Outlook "),
+            )
+            sort_by = alt.param(
+                name="sort_by", value="None",
+                bind=alt.binding_select(options=list(SORT_ORDERS), name="📈 Sort By "),
+            )
+            # Each row's position in every sort order, picked by the sort_by param
+            table = self.table.copy()
+            for label, order in self.sort_orders.items():
+                position = np.empty(len(order), dtype=np.int64)
+                position[order] = np.arange(len(order))
+                table[f"Order {label}"] = position
+            chart = (
+                alt.Chart(table)
+                .mark_bar()
+                .encode(
+                    x=alt.X(
+                        "Career:N",
+                        sort=alt.EncodingSortField(field="Position", op="min", order="ascending"),
+                        axis=alt.Axis(labelAngle=-45),
+                    ),
+                    y=alt.Y("Max Salary:Q", title="Maximum Salary ($)"),
+                    color=alt.Color("Career:N", legend=alt.Legend(title="Career")),
+                    tooltip=["Career", "Min Salary", "Max Salary", "Outlook"],
+                )
+                .add_params(outlook, sort_by)
+                .transform_filter(f"outlook == {json.dumps(ALL_OUTLOOKS)} || datum.Outlook == outlook")
+                .transform_calculate(Position="datum['Order ' + sort_by]")
+                .properties(height=400)
+                .interactive()
+            )
+            self._chart_spec = chart.to_dict()
+        return self._chart_spec
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_salary_catalog(info=None):
+    """Returns the process-wide SalaryCatalog of ``info`` (default CAREER_INFO)."""
+    global _catalog
+    info = CAREER_INFO if info is None else info
+    key = catalog_key(info)
+    with _catalog_lock:
+        if _catalog is None or _catalog.key != key:
+            _catalog = SalaryCatalog(info)
+            for career, problem in _catalog.invalid.items():
+                logger.warning("No salary range for %s: %s", career, problem)
+    return _catalog
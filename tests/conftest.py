@@ -0,0 +1,36 @@
+"""Shared fixtures: small forests on the real feature schema, so they pass check_model."""
+import os
+import pickle
+import sys
+
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modeltest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def dataset():
+    return modeltest.generate_dataset(samples_per_career=8, seed=0)
+
+
+@pytest.fixture(scope="session")
+def make_forest(dataset):
+    """Returns a function fitting a small forest on ``dataset`` with the given parameters."""
+    def make(**params):
+        X, y = dataset
+        return RandomForestClassifier(**{"n_estimators": 8, "random_state": 0, **params}).fit(X, y)
+    return make
+
+
+@pytest.fixture
+def forest_path(tmp_path, make_forest):
+    """Returns a function pickling a small forest under tmp_path; returns its path."""
+    def write(name="career_model.pkl", **params):
+        path = tmp_path / name
+        with open(path, "wb") as f:
+            pickle.dump(make_forest(**params), f)
+        return str(path)
+    return write
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+import batch_score
+from batch_score import check_columns, result_columns, score_file
+from career_schema import FEATURE_NAMES
+from forest_engine import random_profiles
+
+
+def _write_roster(path, **extra):
+    frame = pd.DataFrame(random_profiles(30, seed=1), columns=FEATURE_NAMES)
+    for name, values in extra.items():
+        frame.insert(0, name, values)
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+def test_id_columns_must_not_reuse_result_names(tmp_path):
+    path = _write_roster(tmp_path / "roster.csv", error=range(30), student=range(30))
+    check_columns(path, ["student"])
+    with pytest.raises(ValueError, match="error"):
+        check_columns(path, ["student", "error"])
+    assert {"row", "career_3", "probability_3", "error"} <= set(result_columns(3))
+
+
+def test_missing_columns_are_named(tmp_path):
+    path = _write_roster(tmp_path / "roster.csv")
+    with pytest.raises(ValueError, match="Missing id columns: student"):
+        check_columns(path, ["student"])
+    pd.read_csv(path).drop(columns=["Age"]).to_csv(path, index=False)
+    with pytest.raises(ValueError, match="Missing columns: Age"):
+        check_columns(path)
+
+
+def test_resume_after_interruption_matches_a_full_run(tmp_path, forest_path, monkeypatch):
+    # Quoted ids spanning two lines and a blank line: a resume must count records, not lines
+    path = _write_roster(tmp_path / "roster.csv", student=[f"s{i}\nsecond line" for i in range(30)])
+    with open(path) as f:
+        lines = f.read().split("\n")
+    with open(path, "w") as f:
+        f.write("\n".join(lines[:5] + [""] + lines[5:]))
+    model_path = forest_path()
+    full, resumed = str(tmp_path / "full.csv"), str(tmp_path / "resumed.csv")
+    score_file(path, full, model_path, id_columns=["student"], chunk_rows=7, workers=1)
+
+    save_checkpoint = batch_score._save_checkpoint
+
+    def interrupt_after_two_chunks(checkpoint_path, state):
+        save_checkpoint(checkpoint_path, state)
+        if state["rows_done"] >= 14:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(batch_score, "_save_checkpoint", interrupt_after_two_chunks)
+    with pytest.raises(KeyboardInterrupt):
+        score_file(path, resumed, model_path, id_columns=["student"], chunk_rows=7, workers=1)
+    monkeypatch.setattr(batch_score, "_save_checkpoint", save_checkpoint)
+
+    scored, _ = score_file(path, resumed, model_path, id_columns=["student"], chunk_rows=7, workers=1)
+    assert scored == 30 - 14
+    with open(full, "rb") as a, open(resumed, "rb") as b:
+        assert a.read() == b.read()
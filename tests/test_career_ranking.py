@@ -0,0 +1,38 @@
+import time
+
+import numpy as np
+
+import career_ranking
+from career_ranking import get_ranker, rank_proba
+from career_schema import load_career_model
+from forest_engine import random_profiles
+from model_store import ModelHolder
+
+
+def _wait_closed(pool, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not pool._closed:
+        assert time.monotonic() < deadline, "the replaced pool was never closed"
+        time.sleep(0.05)
+
+
+def test_stale_ranker_keeps_scoring_after_its_pool_is_retired(forest_path, monkeypatch):
+    monkeypatch.setattr(career_ranking, "_ranker", None)
+    monkeypatch.setattr(career_ranking, "RETIRE_GRACE", 0.0)
+    old = ModelHolder(forest_path("old.pkl", random_state=1), loader=load_career_model).get()
+    new = ModelHolder(forest_path("new.pkl", random_state=2), loader=load_career_model).get()
+
+    # Held across the swap, like a fragment or a long batch that fetched it earlier
+    stale = get_ranker(old, micro_batch_wait=0.001, workers=1)
+    fresh = get_ranker(new, workers=1)
+    try:
+        assert fresh is not stale and fresh.version is new
+        _wait_closed(stale.model.model)
+
+        X = random_profiles(20, seed=1)
+        expected = old.model.predict_proba(X)
+        for x, proba in zip(X, expected):
+            assert stale.top_k(x, k=3) == rank_proba(proba, stale.classes, 3)
+        np.testing.assert_array_equal(stale.model.predict_proba(X), expected)
+    finally:
+        career_ranking._close_scorers(fresh.model)
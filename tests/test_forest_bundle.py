@@ -0,0 +1,32 @@
+import os
+import sys
+
+import numpy as np
+
+import forest_bundle
+from forest_bundle import export_forest, load_forest_bundle, read_manifest
+from forest_engine import random_profiles
+from model_store import file_sha256
+
+
+def test_cli_exports_a_pickle_with_its_sha256(forest_path, tmp_path, monkeypatch, capsys):
+    model_path = forest_path()
+    bundle_dir = str(tmp_path / "bundle")
+    monkeypatch.setattr(sys, "argv", ["forest_bundle.py", model_path, "--out", bundle_dir])
+    forest_bundle.main()
+    assert read_manifest(bundle_dir)["source_sha256"] == file_sha256(model_path)
+
+    forest_bundle.main()  # unchanged pickle: nothing to do
+    assert "already" in capsys.readouterr().out
+
+
+def test_export_keeps_the_previous_version(make_forest, tmp_path):
+    X = random_profiles(200, seed=1)
+    first = read_manifest(os.path.dirname(export_forest(make_forest(random_state=1), str(tmp_path))))
+    export_forest(make_forest(random_state=2), str(tmp_path))
+    export_forest(make_forest(random_state=3), str(tmp_path))
+    versions = {entry for entry in os.listdir(tmp_path) if entry.startswith("v")}
+    assert len(versions) == 2 and first["directory"] not in versions
+    np.testing.assert_array_equal(
+        load_forest_bundle(str(tmp_path)).predict_proba(X), make_forest(random_state=3).predict_proba(X)
+    )
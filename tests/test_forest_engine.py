@@ -0,0 +1,56 @@
+import copy
+
+import numpy as np
+import pytest
+
+from forest_bundle import MANIFEST_NAME, export_forest, load_forest_bundle, read_manifest
+from forest_engine import ForestEngine, _jit_walk_kernel, check_parity, load_forest_engine, random_profiles
+
+JIT_MODES = [False] + ([True] if _jit_walk_kernel is not None else [])
+
+
+@pytest.fixture(scope="module")
+def model(make_forest):
+    return make_forest(n_estimators=12)
+
+
+@pytest.fixture(scope="module")
+def rows(dataset):
+    # Random profiles rarely settle early; training rows exercise the early exit
+    return np.vstack([random_profiles(1000, seed=1), dataset[0][::3]])
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+def test_engine_matches_sklearn_bit_for_bit(model, rows, use_jit):
+    engine = ForestEngine.from_estimator(model, use_jit=use_jit)
+    np.testing.assert_array_equal(engine.predict_proba(rows), model.predict_proba(rows))
+    np.testing.assert_array_equal(engine.predict(rows), model.predict(rows))
+    assert check_parity(model, engine, rows) == 0
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+def test_early_exit_matches_full_vote(model, rows, use_jit):
+    engine = ForestEngine.from_estimator(model, use_jit=use_jit)
+    labels, trees_used = engine.predict_early_exit(rows)
+    np.testing.assert_array_equal(labels, model.predict(rows))
+    assert trees_used.max() <= model.n_estimators
+    assert trees_used.min() < model.n_estimators
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+def test_preview_is_the_forest_of_the_first_trees(model, rows, use_jit):
+    first = copy.copy(model)
+    first.estimators_ = model.estimators_[:5]
+    first.n_estimators = 5
+    engine = ForestEngine.from_estimator(model, use_jit=use_jit)
+    np.testing.assert_array_equal(engine.predict_proba(rows, n_trees=5), first.predict_proba(rows))
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+def test_bundle_round_trip(model, rows, tmp_path, use_jit):
+    manifest_path = export_forest(model, str(tmp_path), source_sha256="ab" * 32)
+    assert read_manifest(str(tmp_path))["source_sha256"] == "ab" * 32
+    np.testing.assert_array_equal(load_forest_bundle(manifest_path).predict_proba(rows), model.predict_proba(rows))
+    for path in (str(tmp_path), str(tmp_path / MANIFEST_NAME)):
+        engine = load_forest_engine(path, use_jit=use_jit)
+        np.testing.assert_array_equal(engine.predict_proba(rows), model.predict_proba(rows))
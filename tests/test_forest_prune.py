@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from forest_bundle import FlatForest, flatten_forest, load_forest_bundle, write_bundle
+from forest_engine import ForestEngine, _jit_walk_kernel
+from forest_prune import domain_samples, prune_forest, verify_equivalence
+
+JIT_MODES = [False] + ([True] if _jit_walk_kernel is not None else [])
+
+
+@pytest.fixture(scope="module")
+def model(make_forest):
+    return make_forest(n_estimators=12)
+
+
+@pytest.fixture(scope="module")
+def pruned_arrays(model):
+    return prune_forest(FlatForest(*flatten_forest(model)))
+
+
+@pytest.fixture(scope="module")
+def pruned(pruned_arrays):
+    return FlatForest(*pruned_arrays)
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+def test_pruned_forest_matches_sklearn_on_the_domain(model, pruned, use_jit):
+    X = domain_samples(5000, seed=1)
+    np.testing.assert_array_equal(ForestEngine(pruned, use_jit=use_jit).predict_proba(X), model.predict_proba(X))
+
+
+def test_pruning_shrinks_the_forest(model, pruned):
+    original = FlatForest(*flatten_forest(model))
+    assert len(pruned.feature) < len(original.feature)
+    assert pruned.max_depth <= original.max_depth
+    assert verify_equivalence(original, pruned, n_samples=5000) == 0
+
+
+def test_pruned_bundle_round_trip(model, pruned_arrays, tmp_path):
+    write_bundle(*pruned_arrays, str(tmp_path))
+    X = domain_samples(2000, seed=2)
+    np.testing.assert_array_equal(load_forest_bundle(str(tmp_path)).predict_proba(X), model.predict_proba(X))
@@ -0,0 +1,45 @@
+import sqlite3
+import threading
+
+import prediction_cache
+from prediction_cache import POOL_SIZE, SharedPredictionCache
+
+RANKING = ((3, 0.5), (1, 0.25), (0, 0.25))
+
+
+def test_round_trip_and_model_isolation(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SharedPredictionCache(path, "a" * 64)
+    assert cache.get(b"profile") is None
+    cache.put(b"profile", RANKING)
+    assert cache.get(b"profile") == RANKING
+    assert SharedPredictionCache(path, "a" * 64).get(b"profile") == RANKING
+    assert SharedPredictionCache(path, "b" * 64).get(b"profile") is None  # another model clears the rows
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SharedPredictionCache(str(tmp_path / "cache.sqlite3"), "a" * 64, max_entries=3)
+    for i in range(5):
+        cache.put(bytes([i]), RANKING)
+    assert cache.evict() == 2
+    assert cache.get(b"\x00") is None and cache.get(b"\x04") == RANKING
+
+
+def test_thread_per_call_reuses_pooled_connections(tmp_path, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(prediction_cache.sqlite3, "connect", counting_connect)
+    cache = SharedPredictionCache(str(tmp_path / "cache.sqlite3"), "a" * 64)
+    # One short-lived thread per call, like a Streamlit script run each
+    for i in range(100):
+        thread = threading.Thread(target=lambda i=i: (cache.put(bytes([i]), RANKING), cache.get(bytes([i]))))
+        thread.start()
+        thread.join()
+    assert len(opened) <= POOL_SIZE
+    assert len(cache) == 100
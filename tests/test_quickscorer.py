@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from forest_engine import random_profiles
+from quickscorer import MAX_LEAVES_PER_TREE, QuickScorer, _jit_score_kernel
+
+JIT_MODES = [False] + ([True] if _jit_score_kernel is not None else [])
+
+
+@pytest.mark.parametrize("use_jit", JIT_MODES)
+@pytest.mark.parametrize("max_leaf_nodes", [2, 16, MAX_LEAVES_PER_TREE])
+def test_matches_sklearn_bit_for_bit(make_forest, max_leaf_nodes, use_jit):
+    model = make_forest(max_leaf_nodes=max_leaf_nodes)
+    X = random_profiles(500, seed=1)
+    scorer = QuickScorer.from_estimator(model, use_jit=use_jit)
+    np.testing.assert_array_equal(scorer.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_array_equal(scorer.predict(X), model.predict(X))
+
+
+def test_refuses_trees_wider_than_one_word(make_forest):
+    with pytest.raises(ValueError, match="leaves"):
+        QuickScorer.from_estimator(make_forest(max_leaf_nodes=MAX_LEAVES_PER_TREE + 1))